@@ -11,8 +11,8 @@ echo "📁 Using vault: $OBSIDIAN_VAULT"
 echo "1️⃣ YAML-Header hinzufügen, falls fehlend"
 uv run auto-yaml-header || echo "⚠️ auto-yaml-header fehlgeschlagen, weiter..."
 
-echo "2️⃣ Auto-Tags über einfache Keyword-Regeln"
-uv run auto-tags || echo "⚠️ auto-tags fehlgeschlagen, weiter..."
+echo "2️⃣ Auto-Tags, Personen und Projekte in einem Durchlauf"
+uv run tag-pipeline || echo "⚠️ tag-pipeline fehlgeschlagen, weiter..."
 
 echo "3️⃣ Dateien umbenennen"
 uv run organize rename --rules rules/rename.yml || echo "⚠️ organize rename fehlgeschlagen, weiter..."
@@ -1,52 +1,138 @@
 #!/usr/bin/env python3
+import hashlib
 import os
+import re
+from functools import lru_cache, partial
 from pathlib import Path
 import yaml
 import frontmatter
 
+from secondbrain import cache
+from secondbrain.vault_io import SafeLoader, iter_md, load_fm, process_parallel, split_fm, tag_list, write_bytes, write_parallel
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
 RULES_PATH = Path("rules/auto_tags.yaml")
 
+def _parse_rules(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=SafeLoader) or {}
+    # Erwartet: list von {tag: "project", keywords: ["deadline", ...]}
+    return data.get("rules", [])
+
+@lru_cache(maxsize=1)
+def _parse_rules_cached(path, mtime_ns, size):
+    """_parse_rules, pro Prozess gemerkt, bis sich die Datei (mtime, size) ändert."""
+    return _parse_rules(path)
+
 def load_rules():
-    if not RULES_PATH.exists():
+    try:
+        st = os.stat(RULES_PATH)
+    except FileNotFoundError:
         print(f"⚠️ Keine auto_tags-Regeln gefunden unter {RULES_PATH}, überspringe.")
         return []
-    with open(RULES_PATH, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    # Erwartet: list von {tag: "project", keywords: ["deadline", ...]}
-    return data.get("rules", [])
+    return _parse_rules_cached(os.path.abspath(RULES_PATH), st.st_mtime_ns, st.st_size)
 
-def main():
-    rules = load_rules()
+def normalize_rules(rules):
+    """Bringt die Regeln in die Form ((tag, (keyword, ...)), ...), alles kleingeschrieben.
+
+    Keywords, die nach dem Kleinschreiben doppelt sind, werden nur einmal gesucht.
+    """
+    return tuple(
+        (str(rule["tag"]).lower(), tuple(dict.fromkeys(str(kw).lower() for kw in rule["keywords"])))
+        for rule in rules
+        if rule.get("tag") and rule.get("keywords")
+    )
+
+@lru_cache(maxsize=4)
+def _automaton(rules):
+    """Baut einen Aho-Corasick-Automaten über alle Keywords aller Regeln."""
+    kw_tags = {}
+    for tag, kws in rules:
+        for kw in kws:
+            kw_tags.setdefault(kw, set()).add(tag)
+
+    automaton = ahocorasick.Automaton()
+    for kw, tags in kw_tags.items():
+        automaton.add_word(kw, frozenset(tags))
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=4)
+def _patterns(rules):
+    """Kompiliert pro Regel eine case-insensitive Alternation ihrer Keywords."""
+    return tuple(
+        (tag, re.compile("|".join(map(re.escape, kws)), re.IGNORECASE))
+        for tag, kws in rules
+    )
+
+def match_tags(body, rules):
+    """Liefert alle Tags, deren Keywords (ohne Beachtung der Groß-/Kleinschreibung) im Text vorkommen.
+
+    `body` darf auch reiner ASCII-Text als Bytes sein; er läuft dann durch denselben Matcher.
+    """
     if not rules:
-        return
+        return set()
 
-    print(f"🏷  Wende Auto-Tag-Regeln an auf Vault: {VAULT}")
+    if isinstance(body, bytes):
+        # ASCII ist gültiges Latin-1: das Dekodieren ist eine reine Kopie ohne Validierung
+        body = body.decode("latin-1")
+
+    if ahocorasick is None:
+        return {tag for tag, pattern in _patterns(rules) if pattern.search(body)}
+
+    hits = set()
+    for _end, tags in _automaton(rules).iter(body.lower()):
+        hits |= tags
+    return hits
+
+def _tag_note(path, rules):
+    """Liefert den neuen Notiz-Text, oder None, wenn sich die Tags nicht ändern."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+
+    header, body = split_fm(data)
+    meta = load_fm(header)
+    tags = set(str(t).lower() for t in tag_list(meta.get("tags")))
 
-    for f in VAULT.rglob("*.md"):
-        with open(f, "r", encoding="utf-8") as fh:
-            text = fh.read()
+    # Bei reinem ASCII sind bytes.lower() und str.lower() gleichwertig: kein Dekodieren nötig
+    tags |= match_tags(body if body.isascii() else body.decode("utf-8"), rules)
 
-        post = frontmatter.loads(text)
-        body = post.content
-        tags = set(str(t).lower() for t in post.get("tags", []))
+    new_tags = sorted(tags)
+    if meta.get("tags") == new_tags:
+        return None
 
-        body_lower = body.lower()
+    post = frontmatter.loads(data.decode("utf-8"))
+    post["tags"] = new_tags
+    return frontmatter.dumps(post)
+
+def _process_file(path, rules):
+    text = _tag_note(path, rules)
+    if text is not None:
+        write_bytes(path, text.encode("utf-8"))
+
+def main():
+    rules = normalize_rules(load_rules())
+    if not rules:
+        return
+
+    print(f"🏷  Wende Auto-Tag-Regeln an auf Vault: {VAULT}")
 
-        for rule in rules:
-            tag = rule.get("tag")
-            kws = rule.get("keywords", [])
-            if not tag or not kws:
-                continue
-            if any(kw.lower() in body_lower for kw in kws):
-                tags.add(tag.lower())
+    # Notizen, die seit dem letzten Lauf mit denselben Regeln unverändert sind, überspringen
+    fingerprint = hashlib.sha1(repr(rules).encode("utf-8")).hexdigest()
+    paths = [p for p in iter_md(VAULT) if cache.lookup(p, "auto_tags") != fingerprint]
 
-        post["tags"] = sorted(tags)
-        with open(f, "w", encoding="utf-8") as out:
-            out.write(frontmatter.dumps(post))
+    # Auswerten im Prozess-Pool, Zurückschreiben über den Writer-Pool
+    write_parallel(zip(paths, process_parallel(partial(_tag_note, rules=rules), paths)))
 
-        # Optional: kleine Statusanzeige
-        # print(f"🏷  Updated tags for {f}")
+    for p in paths:
+        cache.store(p, fingerprint, "auto_tags")
+    cache.prune()
+    cache.close()
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,8 @@ import os
 from pathlib import Path
 import frontmatter
 
+from secondbrain.vault_io import iter_md, write_bytes
+
 VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
 
 def has_frontmatter(text: str) -> bool:
@@ -20,7 +22,7 @@ def extract_title(body: str, filename: str) -> str:
 
 def main():
     print(f"🔎 Scanning vault for missing YAML: {VAULT}")
-    for f in VAULT.rglob("*.md"):
+    for f in iter_md(VAULT):
         with open(f, "r", encoding="utf-8") as fh:
             content = fh.read()
 
@@ -28,7 +30,7 @@ def main():
             continue
 
         body = content
-        title = extract_title(body, f.name)
+        title = extract_title(body, os.path.basename(f))
 
         meta = {
             "title": title,
@@ -36,8 +38,7 @@ def main():
         }
 
         post = frontmatter.Post(body, **meta)
-        with open(f, "w", encoding="utf-8") as fh:
-            fh.write(frontmatter.dumps(post))
+        write_bytes(f, frontmatter.dumps(post).encode("utf-8"))
 
         print(f"📝 Added YAML to: {f}")
 
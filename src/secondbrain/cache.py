@@ -0,0 +1,193 @@
+"""
+Persistenter Metadaten-Cache für die Vault-Scripts.
+
+Speichert pro Notiz das Ergebnis einer Auswertung zusammen mit (mtime_ns, size).
+Solange sich beides nicht ändert, muss die Datei nicht erneut gelesen werden.
+
+Abschaltbar über SECONDBRAIN_CACHE=false. Lässt sich die Datenbank nicht
+öffnen (z.B. weil der Vault-Ordner fehlt), laufen die Scripts ohne Cache weiter.
+"""
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from decouple import config
+
+from secondbrain.vault_io import read_parallel
+
+try:
+    import orjson  # optional: pip install orjson
+except ImportError:
+    orjson = None
+
+USE_CACHE = config("SECONDBRAIN_CACHE", default="true").lower() == "true"
+
+VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
+CACHE_NAME = ".secondbrain_cache.sqlite"
+CACHE_PATH = VAULT / CACHE_NAME
+
+_conn = None
+# CACHE_PATH, der sich nicht öffnen ließ (kein erneuter Versuch pro Aufruf)
+_failed_path = None
+
+if orjson is not None:
+    # Nicht-String-Keys wie json.dumps zulassen, Datumswerte wie bisher über str() ausgeben
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _dumps(payload) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str, option=_ORJSON_OPTS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # z.B. Ganzzahlen über 64 Bit
+    return json.dumps(payload, default=str)
+
+
+def _loads(text):
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # z.B. NaN aus älteren Einträgen
+    return json.loads(text)
+
+
+def _connect():
+    """Öffnet die Datenbank beim ersten Zugriff; liefert None, wenn das nicht geht."""
+    global _conn, _failed_path
+    if _conn is None:
+        if _failed_path == CACHE_PATH:
+            return None
+        conn = None
+        try:
+            conn = sqlite3.connect(CACHE_PATH)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " kind TEXT NOT NULL,"
+                " path TEXT NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " PRIMARY KEY (kind, path))"
+            )
+        except sqlite3.Error as e:
+            if conn is not None:
+                conn.close()
+            print(f"⚠️ Cache nicht verfügbar ({CACHE_PATH}): {e}, arbeite ohne Cache.")
+            _failed_path = CACHE_PATH
+            return None
+        _conn = conn
+    return _conn
+
+
+def use_vault(vault_path):
+    """Legt den Cache in den angegebenen Vault statt in $OBSIDIAN_VAULT.
+
+    Eine offene Verbindung zu einem anderen Vault wird vorher geschlossen.
+    """
+    global CACHE_PATH
+    path = Path(vault_path).expanduser() / CACHE_NAME
+    if path != CACHE_PATH:
+        close()
+        CACHE_PATH = path
+
+
+def lookup(path, kind: str = "fm"):
+    """Liefert den gespeicherten Wert, falls die Datei seitdem unverändert ist, sonst None."""
+    if not USE_CACHE:
+        return None
+    conn = _connect()
+    if conn is None:
+        return None
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        # Notiz inzwischen gelöscht/verschoben: wie ein Fehlschlag behandeln
+        return None
+    row = conn.execute(
+        "SELECT mtime_ns, size, payload FROM entries WHERE kind = ? AND path = ?",
+        (kind, os.fspath(path)),
+    ).fetchone()
+    if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+        return _loads(row[2])
+    return None
+
+
+def store(path, payload, kind: str = "fm"):
+    """Speichert `payload` für den aktuellen Stand (mtime, size) der Datei."""
+    if not USE_CACHE:
+        return
+    conn = _connect()
+    if conn is None:
+        return
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO entries (kind, path, mtime_ns, size, payload) VALUES (?, ?, ?, ?, ?)",
+        (kind, os.fspath(path), st.st_mtime_ns, st.st_size, _dumps(payload)),
+    )
+
+
+def get_or_compute(path, compute_fn, kind: str = "fm"):
+    """Liefert den Cache-Eintrag oder berechnet ihn mit `compute_fn(path)` neu."""
+    payload = lookup(path, kind)
+    if payload is None:
+        payload = compute_fn(path)
+        store(path, payload, kind)
+    return payload
+
+
+def get_or_compute_many(paths, compute_fn, kind: str = "fm") -> list:
+    """Wie get_or_compute für viele Pfade; Cache-Fehlschläge werden parallel in Threads berechnet.
+
+    Die SQLite-Verbindung wird nur im aufrufenden Thread benutzt.
+    """
+    paths = list(paths)
+    results = [lookup(p, kind) for p in paths]
+    missing = [i for i, payload in enumerate(results) if payload is None]
+
+    computed = read_parallel(compute_fn, [paths[i] for i in missing])
+    for i, payload in zip(missing, computed):
+        results[i] = payload
+        store(paths[i], payload, kind)
+    return results
+
+
+def invalidate(path):
+    """Entfernt alle Einträge einer (verschobenen oder gelöschten) Datei."""
+    if not USE_CACHE:
+        return
+    conn = _connect()
+    if conn is None:
+        return
+    conn.execute("DELETE FROM entries WHERE path = ?", (os.fspath(path),))
+
+
+def prune() -> int:
+    """Entfernt die Einträge aller Dateien, die es nicht mehr gibt (gelöscht, umbenannt, verschoben).
+
+    Liefert die Anzahl entfernter Pfade.
+    """
+    if not USE_CACHE:
+        return 0
+    conn = _connect()
+    if conn is None:
+        return 0
+    gone = [row for row in conn.execute("SELECT DISTINCT path FROM entries") if not os.path.exists(row[0])]
+    conn.executemany("DELETE FROM entries WHERE path = ?", gone)
+    return len(gone)
+
+
+def close():
+    """Schreibt offene Änderungen und schließt die Verbindung."""
+    global _conn
+    if _conn is not None:
+        _conn.commit()
+        _conn.close()
+        _conn = None
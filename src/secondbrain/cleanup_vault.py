@@ -5,10 +5,40 @@ Räumt den Vault auf:
 - Optional: Verschiebt sie automatisch
 """
 from decouple import config
+import os
+import re
 import sys
-import shutil
 from pathlib import Path
 
+from secondbrain import cache
+from secondbrain.init_vault import PARA_FOLDERS
+from secondbrain.vault_io import SKIP_DIRS, count_md, move_path
+
+# Projekt-Keywords
+PROJECT_KEYWORDS = (
+    "project", "app", "tool", "updater", "generator",
+    "validator", "sync", "playground", "template"
+)
+
+# Resource-Keywords (deutsch und englisch)
+RESOURCE_KEYWORDS = (
+    "whitepaper", "dokumente", "dokumentation", "document", "documentation",
+    "report", "research", "paper", "decision"
+)
+
+# Area-Keywords
+AREA_KEYWORDS = (
+    "infrastructure", "iac", "configuration", "batch", "acc"
+)
+
+# Je Kategorie eine vorkompilierte Alternation (Reihenfolge = Priorität)
+_PROJECT_RE = re.compile("|".join(map(re.escape, PROJECT_KEYWORDS)))
+_RESOURCE_RE = re.compile("|".join(map(re.escape, RESOURCE_KEYWORDS)))
+_AREA_RE = re.compile("|".join(map(re.escape, AREA_KEYWORDS)))
+
+# PARA-Ordner und System-Ordner
+_SKIP_FOLDERS = frozenset(PARA_FOLDERS) | SKIP_DIRS
+
 
 def get_vault_path():
     """Get the path to the Obsidian vault from the OBSIDIAN_VAULT environment variable."""
@@ -19,17 +49,12 @@ def get_vault_path():
 def find_old_folders(vault_path: Path):
     """Findet Ordner im Root, die nicht zur PARA-Struktur gehören."""
     
-    # PARA-Ordner und System-Ordner
-    skip_folders = {
-        "01_Projects", "02_Areas", "03_Resources", "04_Archive",
-        ".obsidian", ".trash", ".git", ".smart-env"
-    }
-    
-    old_folders = []
-    
-    for item in vault_path.iterdir():
-        if item.is_dir() and item.name not in skip_folders:
-            old_folders.append(item)
+    # scandir liefert den Typ aus dem Verzeichniseintrag, Path nur für Treffer
+    with os.scandir(vault_path) as it:
+        old_folders = [
+            Path(e.path) for e in it
+            if e.name not in _SKIP_FOLDERS and e.is_dir()
+        ]
     
     return sorted(old_folders, key=lambda x: x.name)
 
@@ -39,34 +64,14 @@ def suggest_para_location(folder_name: str) -> str:
     
     name_lower = folder_name.lower()
     
-    # Projekt-Keywords
-    project_keywords = [
-        "project", "app", "tool", "updater", "generator", 
-        "validator", "sync", "playground", "template"
-    ]
+    if _PROJECT_RE.search(name_lower):
+        return "01_Projects"
     
-    # Resource-Keywords
-    resource_keywords = [
-        "whitepaper", "dokumente", "dokumentation", "report", 
-        "research", "paper", "decision"
-    ]
+    if _RESOURCE_RE.search(name_lower):
+        return "03_Resources"
     
-    # Area-Keywords
-    area_keywords = [
-        "infrastructure", "iac", "configuration", "batch", "acc"
-    ]
-    
-    for keyword in project_keywords:
-        if keyword in name_lower:
-            return "01_Projects"
-    
-    for keyword in resource_keywords:
-        if keyword in name_lower:
-            return "03_Resources"
-    
-    for keyword in area_keywords:
-        if keyword in name_lower:
-            return "02_Areas"
+    if _AREA_RE.search(name_lower):
+        return "02_Areas"
     
     # Default: Projects (meistens sind es aktive Projekte)
     return "01_Projects"
@@ -79,22 +84,23 @@ def show_overview(vault_path: Path, old_folders: list):
         vault_path (Path): Path to the vault root.
         old_folders (list): List of Path objects for folders outside PARA.
     """
-    print(f"\n📊 Vault Structure Overview: {vault_path}")
-    print(f"\n🗂  Folders outside PARA: {len(old_folders)}\n")
+    # Report sammeln und mit einem write() ausgeben
+    lines = [
+        f"\n📊 Vault Structure Overview: {vault_path}",
+        f"\n🗂  Folders outside PARA: {len(old_folders)}\n",
+    ]
     if not old_folders:
-        print("✅ All folders are already in the PARA structure!")
-        return
+        lines.append("✅ All folders are already in the PARA structure!")
     suggestions = {}
     for folder in old_folders:
         suggested = suggest_para_location(folder.name)
         suggestions.setdefault(suggested, []).append(folder)
-    for para_folder in ["01_Projects", "02_Areas", "03_Resources", "04_Archive"]:
+    for para_folder in PARA_FOLDERS:
         if para_folder in suggestions:
             folders = suggestions[para_folder]
-            print(f"\n📁 {para_folder}/ ({len(folders)} folders):")
-            for folder in folders:
-                md_files = list(folder.rglob("*.md"))
-                print(f"   → {folder.name:40} ({len(md_files)} .md files)")
+            lines.append(f"\n📁 {para_folder}/ ({len(folders)} folders):")
+            lines += [f"   → {folder.name:40} ({count_md(folder)} .md files)" for folder in folders]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def move_folders(vault_path: Path, old_folders: list, dry_run: bool = True):
@@ -107,6 +113,7 @@ def move_folders(vault_path: Path, old_folders: list, dry_run: bool = True):
     """
     print(f"\n{'🔍 DRY RUN - ' if dry_run else '📦 '}Moving folders...\n")
     moved = 0
+    created_dirs = set()
     for folder in old_folders:
         suggested = suggest_para_location(folder.name)
         target_dir = vault_path / suggested
@@ -118,7 +125,10 @@ def move_folders(vault_path: Path, old_folders: list, dry_run: bool = True):
             print(f"[DRY] {folder.name} → {suggested}/")
         else:
             try:
-                shutil.move(str(folder), str(target_path))
+                if target_dir not in created_dirs:
+                    target_dir.mkdir(exist_ok=True)
+                    created_dirs.add(target_dir)
+                move_path(folder, target_path)
                 print(f"✅ {folder.name} → {suggested}/")
                 moved += 1
             except Exception as e:
@@ -126,6 +136,12 @@ def move_folders(vault_path: Path, old_folders: list, dry_run: bool = True):
     if dry_run:
         print(f"\n💡 Use --move to actually move the folders")
     else:
+        if moved:
+            # Cache-Einträge der verschobenen Notizen entfernen (falls der Vault einen Cache hat)
+            cache.use_vault(vault_path)
+            if os.path.exists(cache.CACHE_PATH):
+                cache.prune()
+                cache.close()
         print(f"\n✅ {moved} folders moved successfully!")
 
 
@@ -155,6 +171,11 @@ def main():
         action="store_true",
         help="Show what would be moved, without moving"
     )
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help="Move without asking for confirmation (for scripts/CI)"
+    )
     args = parser.parse_args()
     vault_path = get_vault_path()
     if not vault_path.exists():
@@ -167,8 +188,12 @@ def main():
         if not old_folders:
             print("\n✅ No folders to move found!")
             return
-        if args.move and not args.dry_run:
+        if args.move and not args.dry_run and not args.yes:
             print("\n⚠️  WARNING: This will move folders!")
+            # Ohne Terminal nicht auf eine Eingabe warten, die nie kommt
+            if not sys.stdin.isatty():
+                print("Aborted: no terminal for confirmation, use --yes.")
+                return
             response = input("Continue? [y/N]: ")
             if response.lower() != 'y':
                 print("Aborted.")
@@ -5,7 +5,25 @@ Erstellt Daily Notes im Vault und verlinkt bestehende Inhalte.
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
-import frontmatter
+
+from secondbrain.vault_io import ensure_dir, iter_md, write_bytes
+
+# Fester Teil des Daily-Note-Templates (unter der Datums-Überschrift)
+_DAILY_SECTIONS = """
+
+## 📝 Notes
+
+
+## ✅ Tasks
+
+- [ ] 
+
+## 🔗 Links
+
+
+## 💭 Reflections
+
+"""
 
 
 def get_vault_path():
@@ -16,15 +34,9 @@ def get_vault_path():
 
 def create_daily_notes_structure(vault_path: Path):
     """Erstellt die Daily Notes Ordnerstruktur."""
-    daily_path = vault_path / "Daily"
-    daily_path.mkdir(exist_ok=True)
-    
     # Unterordner nach Jahren
     current_year = datetime.now().year
-    year_path = daily_path / str(current_year)
-    year_path.mkdir(exist_ok=True)
-    
-    return year_path
+    return ensure_dir(vault_path / "Daily" / str(current_year))
 
 
 def get_daily_note_path(vault_path: Path, date: datetime = None) -> Path:
@@ -32,8 +44,7 @@ def get_daily_note_path(vault_path: Path, date: datetime = None) -> Path:
     if date is None:
         date = datetime.now()
     
-    year_path = vault_path / "Daily" / str(date.year)
-    year_path.mkdir(parents=True, exist_ok=True)
+    year_path = ensure_dir(vault_path / "Daily" / str(date.year))
     
     filename = date.strftime("%Y-%m-%d.md")
     return year_path / filename
@@ -41,15 +52,14 @@ def get_daily_note_path(vault_path: Path, date: datetime = None) -> Path:
 
 def create_daily_note(vault_path: Path, date: datetime = None, content: str = None):
     """Erstellt eine Daily Note."""
+    # python-frontmatter nur bei Bedarf laden; yaml selbst ist über vault_io ohnehin geladen
+    import frontmatter
+    
     if date is None:
         date = datetime.now()
     
     daily_path = get_daily_note_path(vault_path, date)
     
-    if daily_path.exists():
-        print(f"✓ Daily Note existiert bereits: {daily_path.name}")
-        return daily_path
-    
     # Template für Daily Note
     post = frontmatter.Post(content or "")
     post.metadata = {
@@ -59,26 +69,16 @@ def create_daily_note(vault_path: Path, date: datetime = None, content: str = No
     }
     
     # Content
-    daily_content = f"""# {date.strftime('%A, %d. %B %Y')}
-
-## 📝 Notes
-
-
-## ✅ Tasks
-
-- [ ] 
-
-## 🔗 Links
-
-
-## 💭 Reflections
-
-"""
-    
-    post.content = daily_content
-    
-    with open(daily_path, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
+    post.content = f"# {date.strftime('%A, %d. %B %Y')}{_DAILY_SECTIONS}"
+    text = frontmatter.dumps(post)
+    
+    # Exklusiv anlegen statt exists() + open(): ein Syscall, kein Überschreiben
+    try:
+        with open(daily_path, "x", encoding="utf-8") as f:
+            f.write(text)
+    except FileExistsError:
+        print(f"✓ Daily Note existiert bereits: {daily_path.name}")
+        return daily_path
     
     print(f"✓ Daily Note erstellt: {daily_path.name}")
     return daily_path
@@ -90,38 +90,47 @@ def scan_recent_files(vault_path: Path, days: int = 7):
     
     recent_files = {}
     
-    for md_file in vault_path.rglob("*.md"):
+    # Reine String-Operationen; Path-Objekte nur für die Treffer
+    vault_root = os.path.normpath(vault_path)
+    prefix_len = len(os.path.join(vault_root, ""))
+    for md_file in iter_md(vault_root):
         # Überspringe Daily Notes, Index-Dateien, etc.
-        if "Daily" in md_file.parts or "Index" in md_file.name:
+        if "Index" in os.path.basename(md_file):
+            continue
+        if "Daily" in md_file[prefix_len:].split(os.sep):
             continue
         
-        mtime = md_file.stat().st_mtime
+        mtime = os.stat(md_file).st_mtime
         if mtime > cutoff_time:
             file_date = datetime.fromtimestamp(mtime).date()
             if file_date not in recent_files:
                 recent_files[file_date] = []
-            recent_files[file_date].append(md_file)
+            recent_files[file_date].append(Path(md_file))
     
     return recent_files
 
 
-def add_link_to_daily(daily_path: Path, file_path: Path, section: str = "Links"):
-    """Fügt einen Link zur Daily Note hinzu."""
+def add_links_to_daily(daily_path: Path, file_paths, section: str = "Links"):
+    """Fügt Links zu mehreren Dateien hinzu; die Daily Note wird nur einmal gelesen und geschrieben."""
+    import frontmatter
     
-    if not daily_path.exists():
+    try:
+        post = frontmatter.load(daily_path)
+    except FileNotFoundError:
         return
-    
-    post = frontmatter.load(daily_path)
     content = post.content
     
-    # Link erstellen
-    link = f"- [[{file_path.stem}]]"
+    # Links erstellen, bereits vorhandene überspringen
+    links = []
+    for file_path in file_paths:
+        link = f"- [[{file_path.stem}]]"
+        if link not in content and link not in links:
+            links.append(link)
     
-    # Prüfe ob Link schon existiert
-    if link in content:
+    if not links:
         return
     
-    # Füge Link unter passender Section hinzu
+    # Füge Links unter passender Section hinzu
     section_marker = f"## 🔗 {section}"
     
     if section_marker in content:
@@ -136,23 +145,26 @@ def add_link_to_daily(daily_path: Path, file_path: Path, section: str = "Links")
                 in_section = True
             elif in_section and not added and (line.startswith('##') or not line.strip()):
                 if line.strip():  # Nächste Section
-                    new_lines.insert(-1, link)
-                    new_lines.insert(-1, "")
+                    new_lines[-1:-1] = links + [""]
                 else:
-                    new_lines.insert(-1, link)
+                    new_lines[-1:-1] = links
                 added = True
                 in_section = False
         
         if not added:
-            new_lines.append(link)
+            new_lines.extend(links)
         
         post.content = '\n'.join(new_lines)
     else:
         # Section existiert nicht, füge sie hinzu
-        post.content += f"\n\n{section_marker}\n\n{link}\n"
+        post.content += f"\n\n{section_marker}\n\n" + "\n".join(links) + "\n"
     
-    with open(daily_path, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
+    write_bytes(daily_path, frontmatter.dumps(post).encode("utf-8"))
+
+
+def add_link_to_daily(daily_path: Path, file_path: Path, section: str = "Links"):
+    """Fügt einen Link zur Daily Note hinzu."""
+    add_links_to_daily(daily_path, [file_path], section)
 
 
 def main():
@@ -228,9 +240,8 @@ def main():
                 daily_date = datetime.combine(file_date, datetime.min.time())
                 daily_path = create_daily_note(vault_path, daily_date)
                 
-                # Links hinzufügen
-                for f in files:
-                    add_link_to_daily(daily_path, f)
+                # Links hinzufügen (ein Lese- und Schreibvorgang pro Daily Note)
+                add_links_to_daily(daily_path, files)
                 
                 print(f"   ✓ {len(files)} Links hinzugefügt zu {daily_path.name}")
             
@@ -2,17 +2,19 @@
 import os
 from pathlib import Path
 from collections import defaultdict
-import frontmatter
+
+from secondbrain import cache
+from secondbrain.vault_io import iter_md, note_stem, read_fm, write_if_changed
 
 VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
 
 def main():
     clusters = defaultdict(list)
 
-    for f in VAULT.rglob("*.md"):
-        post = frontmatter.load(f)
-        topics = post.get("topics") or []
-        tags = post.get("tags") or []
+    paths = list(iter_md(VAULT))
+    for f, meta in zip(paths, cache.get_or_compute_many(paths, read_fm)):
+        topics = meta.get("topics") or []
+        tags = meta.get("tags") or []
 
         # Topics priorisieren, ansonsten Tags nutzen
         labels = topics if topics else tags
@@ -23,17 +25,18 @@ def main():
 
     output = VAULT / "Semantic_Clusters.md"
 
-    with open(output, "w", encoding="utf-8") as out:
-        out.write("# Semantic Cluster Map\n\n")
-        if not clusters:
-            out.write("_Keine Topics/Tags gefunden._\n")
-            return
-
-        for label, files in sorted(clusters.items(), key=lambda x: x[0].lower()):
-            out.write(f"## {label}\n")
-            for f in files:
-                out.write(f"- [[{f.stem}]]\n")
-            out.write("\n")
+    buf = ["# Semantic Cluster Map\n\n"]
+    if not clusters:
+        buf.append("_Keine Topics/Tags gefunden._\n")
+
+    for label, files in sorted(clusters.items(), key=lambda x: x[0].lower()):
+        buf.append(f"## {label}\n")
+        buf.extend(f"- [[{note_stem(f)}]]\n" for f in files)
+        buf.append("\n")
+
+    write_if_changed(output, "".join(buf))
+    cache.prune()
+    cache.close()
 
 if __name__ == "__main__":
     main()
@@ -1,27 +1,38 @@
 import os
+import re
 from pathlib import Path
-import frontmatter
+
+from secondbrain import cache
+from secondbrain.vault_io import iter_md, load_fm, note_stem, read_fm_header, write_if_changed
 
 VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
 
+_TITLE_RE = re.compile(rb"^title\s*:", re.MULTILINE)
+
+def read_title(path, limit=8192):
+    """Liest nur `title` aus dem Frontmatter; YAML wird nur geparst, wenn es eine title-Zeile gibt."""
+    header = read_fm_header(path, limit)
+    if not _TITLE_RE.search(header):
+        return {}
+    meta = load_fm(header)
+    return {"title": meta["title"]} if "title" in meta else {}
+
 def build_moc(category, path):
-    output = Path(VAULT) / f"{category}_Index.md"
-    entries = []
+    output = VAULT / f"{category}_Index.md"
 
-    for f in Path(VAULT, path).rglob("*.md"):
-        meta = frontmatter.load(f)
-        title = meta.get("title", f.stem)
-        entries.append(f"- [[{f.stem}|{title}]]")
+    paths = list(iter_md(VAULT / path))
+    metas = cache.get_or_compute_many(paths, read_title, kind="title")
+    stems = map(note_stem, paths)
+    entries = "\n".join(f"- [[{stem}|{meta.get('title', stem)}]]" for stem, meta in zip(stems, metas))
 
-    with open(output, "w") as outf:
-        outf.write(f"# {category} Index\n\n")
-        outf.write("\n".join(entries))
+    write_if_changed(output, f"# {category} Index\n\n" + entries)
 
 def main():
     build_moc("Projects", "01_Projects")
     build_moc("Areas", "02_Areas")
     build_moc("Resources", "03_Resources")
     build_moc("Archive", "04_Archive")
+    cache.close()
 
 if __name__ == "__main__":
     main()
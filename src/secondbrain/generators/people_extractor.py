@@ -3,19 +3,47 @@ import re
 import frontmatter
 from pathlib import Path
 
+from secondbrain.vault_io import iter_md, process_parallel, tag_list, write_parallel
+
 VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
 
 name_pattern = re.compile(r"\b[A-Z][a-z]+\s[A-Z][a-z]+\b")
+# Billiger Vorfilter: ohne Großbuchstabe + Kleinbuchstabe kann kein Name vorkommen
+_UPPER_RE = re.compile(r"[A-Z][a-z]")
+
+# Dieselben Muster für reinen ASCII-Text als Bytes
+_NAME_RE_BYTES = re.compile(name_pattern.pattern.encode("ascii"))
+_UPPER_RE_BYTES = re.compile(_UPPER_RE.pattern.encode("ascii"))
+
+def detect_people(body):
+    """True, wenn der Text (str oder ASCII-Bytes) mindestens einen Namen enthält."""
+    if isinstance(body, bytes):
+        return bool(_UPPER_RE_BYTES.search(body) and _NAME_RE_BYTES.search(body))
+    return bool(_UPPER_RE.search(body) and name_pattern.search(body))
+
+def _tag_note(f):
+    """Liefert den neuen Notiz-Text mit #person, oder None, wenn nichts zu ändern ist."""
+    with open(f, "r", encoding="utf-8") as fh:
+        text = fh.read()
+
+    if not _UPPER_RE.search(text):
+        return None
+
+    post = frontmatter.loads(text)
+    if not detect_people(post.content):
+        return None
+
+    tags = sorted(map(str, tag_list(post.get("tags"))))
+    new_tags = sorted(set(tags) | {"person"})
+    if tags == new_tags:
+        return None
+
+    post["tags"] = new_tags
+    return frontmatter.dumps(post)
 
 def main():
-    for f in Path(VAULT).rglob("*.md"):
-        text = open(f).read()
-        names = name_pattern.findall(text)
-        meta = frontmatter.load(f)
-        if names:
-            meta["tags"] = list(set(meta.get("tags", []) + ["person"]))
-            with open(f, "w") as out:
-                out.write(frontmatter.dumps(meta))
+    paths = list(iter_md(VAULT))
+    write_parallel(zip(paths, process_parallel(_tag_note, paths)))
 
 if __name__ == "__main__":
     main()
@@ -2,16 +2,38 @@ import os
 import frontmatter
 from pathlib import Path
 
+from secondbrain.auto_tags import match_tags
+from secondbrain.vault_io import iter_md, process_parallel, tag_list, write_parallel
+
 VAULT = Path(os.environ.get("OBSIDIAN_VAULT", "~/Obsidian")).expanduser()
 
+PROJECT_RULES = (("project", ("deadline", "deliverable", "milestone")),)
+
+def detect_project(meta):
+    """True, wenn die `summary` im Frontmatter auf ein Projekt hinweist."""
+    # `summary:` ohne Wert ist None, Zahlen/Datumswerte kommen als Nicht-String an
+    return bool(match_tags(str(meta.get("summary") or ""), PROJECT_RULES))
+
+def _tag_note(f):
+    """Liefert den neuen Notiz-Text mit #project, oder None, wenn nichts zu ändern ist."""
+    with open(f, "r", encoding="utf-8") as fh:
+        text = fh.read()
+
+    post = frontmatter.loads(text)
+    if not detect_project(post.metadata):
+        return None
+
+    tags = sorted(map(str, tag_list(post.get("tags"))))
+    new_tags = sorted(set(tags) | {"project"})
+    if tags == new_tags:
+        return None
+
+    post["tags"] = new_tags
+    return frontmatter.dumps(post)
+
 def main():
-    for f in Path(VAULT).rglob("*.md"):
-        meta = frontmatter.load(f)
-        summary = meta.get("summary", "")
-        if any(x in summary.lower() for x in ["deadline", "deliverable", "milestone"]):
-            meta["tags"] = list(set(meta.get("tags", []) + ["project"]))
-            with open(f, "w") as out:
-                out.write(frontmatter.dumps(meta))
+    paths = list(iter_md(VAULT))
+    write_parallel(zip(paths, process_parallel(_tag_note, paths)))
 
 if __name__ == "__main__":
     main()
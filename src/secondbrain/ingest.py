@@ -8,8 +8,16 @@ from pathlib import Path
 # Example function for reading markdown
 
 def read_markdown(path: Path) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    # Read once as bytes; non-UTF-8 exports fall back to latin-1 without a second open
+    data = Path(path).read_bytes()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    # Same newline handling as text mode
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 # Main ingest function
 
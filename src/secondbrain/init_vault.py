@@ -6,70 +6,107 @@ import os
 import sys
 from pathlib import Path
 
+# PARA-Ordner in Anzeige-Reihenfolge
+PARA_FOLDERS = ("01_Projects", "02_Areas", "03_Resources", "04_Archive")
+
+# Statischer Abschlusstext, einmal beim Import zusammengesetzt
+_NEXT_STEPS = (
+    "\n✅ PARA-Struktur initialisiert!\n"
+    "\nNächste Schritte:\n"
+    "  1. Verschiebe Projekt-Ordner nach 01_Projects/\n"
+    "  2. Organisiere bestehende Notizen mit: ./bootstrap-secondbrain.sh\n"
+    "  3. Oder manuell mit: python3 organize.py move --rules rules/categorize.yaml\n"
+)
+
 
 def create_para_structure(vault_path: Path, dry_run: bool = False):
     """Erstellt die PARA-Ordnerstruktur."""
     
-    folders = [
-        "01_Projects",
-        "02_Areas", 
-        "03_Resources",
-        "04_Archive",
-    ]
-    
     print(f"📁 Vault: {vault_path}")
     print(f"{'🔍 DRY RUN - ' if dry_run else ''}Erstelle PARA-Struktur...\n")
     
-    for folder in folders:
-        folder_path = vault_path / folder
-        
-        if folder_path.exists():
-            print(f"✓ {folder} existiert bereits")
-        else:
-            if not dry_run:
-                folder_path.mkdir(parents=True, exist_ok=True)
-            print(f"{'[DRY] ' if dry_run else '✓ '}{folder} erstellt")
+    # Ein scandir statt exists() + mkdir() pro Ordner; angelegt wird nur, was fehlt
+    try:
+        with os.scandir(vault_path) as it:
+            existing = {e.name for e in it if e.is_dir()}
+    except FileNotFoundError:
+        existing = set()
     
-    # .gitkeep Dateien erstellen (damit leere Ordner in Git bleiben)
+    vault_str = os.fspath(vault_path)
+    dir_fd = None
     if not dry_run:
-        for folder in folders:
-            gitkeep = vault_path / folder / ".gitkeep"
-            if not gitkeep.exists():
-                gitkeep.touch()
+        os.makedirs(vault_str, exist_ok=True)
+        # Vault-Ordner einmal öffnen; die Unterordner werden relativ dazu angelegt,
+        # ohne den Pfad für jeden Ordner neu aufzulösen
+        if {os.mkdir, os.open} <= os.supports_dir_fd:
+            dir_fd = os.open(vault_str, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
     
-    print("\n✅ PARA-Struktur initialisiert!")
-    print("\nNächste Schritte:")
-    print("  1. Verschiebe Projekt-Ordner nach 01_Projects/")
-    print("  2. Organisiere bestehende Notizen mit: ./bootstrap-secondbrain.sh")
-    print("  3. Oder manuell mit: python3 organize.py move --rules rules/categorize.yaml")
+    try:
+        for folder in PARA_FOLDERS:
+            if folder in existing:
+                print(f"✓ {folder} existiert bereits")
+            else:
+                if not dry_run:
+                    try:
+                        os.mkdir(folder if dir_fd is not None else os.path.join(vault_str, folder), dir_fd=dir_fd)
+                    except FileExistsError:
+                        pass
+                print(f"{'[DRY] ' if dry_run else '✓ '}{folder} erstellt")
+        
+        # .gitkeep Dateien erstellen (damit leere Ordner in Git bleiben);
+        # O_EXCL legt nur fehlende an und spart den exists()-Check
+        if not dry_run:
+            for folder in PARA_FOLDERS:
+                gitkeep = os.path.join(folder, ".gitkeep")
+                try:
+                    os.close(os.open(
+                        gitkeep if dir_fd is not None else os.path.join(vault_str, gitkeep),
+                        os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                        0o666,
+                        dir_fd=dir_fd,
+                    ))
+                except FileExistsError:
+                    pass
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    sys.stdout.write(_NEXT_STEPS)
 
 
 def show_migration_info(vault_path: Path):
     """Zeigt Info über bestehende Inhalte."""
     
-    # Zähle existierende Ordner und Files
-    dirs = [d for d in vault_path.iterdir() 
-            if d.is_dir() and not d.name.startswith('.')]
-    
-    md_files = list(vault_path.glob("*.md"))
+    # Zähle existierende Ordner und Files in einem scandir-Durchlauf
+    dirs = []
+    md_files = []
+    with os.scandir(vault_path) as it:
+        for e in it:
+            if e.name.endswith(".md"):
+                md_files.append(e.name)
+            elif not e.name.startswith('.') and e.is_dir():
+                dirs.append(e.name)
     
-    print("\n📊 Bestehende Inhalte:")
-    print(f"   Ordner: {len(dirs)}")
-    print(f"   Markdown-Dateien (root): {len(md_files)}")
+    # Ausgabe sammeln und mit einem write() schreiben
+    out = [
+        "\n📊 Bestehende Inhalte:",
+        f"   Ordner: {len(dirs)}",
+        f"   Markdown-Dateien (root): {len(md_files)}",
+    ]
     
     if dirs:
-        print("\n📂 Ordner (werden nicht automatisch verschoben):")
-        for d in sorted(dirs)[:10]:  # Zeige max. 10
-            print(f"   - {d.name}")
+        out.append("\n📂 Ordner (werden nicht automatisch verschoben):")
+        out += [f"   - {d}" for d in sorted(dirs)[:10]]  # Zeige max. 10
         if len(dirs) > 10:
-            print(f"   ... und {len(dirs) - 10} weitere")
+            out.append(f"   ... und {len(dirs) - 10} weitere")
     
     if md_files:
-        print("\n📝 Markdown-Dateien im Root:")
-        for f in sorted(md_files)[:5]:
-            print(f"   - {f.name}")
+        out.append("\n📝 Markdown-Dateien im Root:")
+        out += [f"   - {f}" for f in sorted(md_files)[:5]]
         if len(md_files) > 5:
-            print(f"   ... und {len(md_files) - 5} weitere")
+            out.append(f"   ... und {len(md_files) - 5} weitere")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
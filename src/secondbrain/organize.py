@@ -1,8 +1,11 @@
 import os
-import shutil
+import sys
 import frontmatter
 from datetime import datetime
+from functools import partial
+from secondbrain import cache
 from secondbrain.translator import translate_markdown # Added this import
+from secondbrain.vault_io import ensure_dir, iter_md, move_path, process_parallel
 
 def should_process_file(file_path, vault_path):
     """
@@ -12,10 +15,14 @@ def should_process_file(file_path, vault_path):
     - It's not in the 'Templates' directory.
     - It's not the README.md in the vault root.
     """
-    if not file_path.lower().endswith('.md'):
+    return _should_process_relative(os.path.relpath(file_path, vault_path))
+
+
+def _should_process_relative(relative_path):
+    """should_process_file for a path that is already relative to the vault."""
+    if not relative_path.lower().endswith('.md'):
         return False
 
-    relative_path = os.path.relpath(file_path, vault_path)
     path_components = relative_path.split(os.sep)
 
     if any(part.startswith('.') for part in path_components):
@@ -30,9 +37,10 @@ def should_process_file(file_path, vault_path):
     return True
 
 
-def process_and_move_file(file_path, vault_path, daily_notes_path):
+def plan_move(file_path, daily_notes_path):
     """
-    Processes a single Markdown file and moves it to the appropriate directory.
+    Determines the target path of a single Markdown file without touching the disk.
+    Returns the new path if the file has to be moved, otherwise None.
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -49,14 +57,10 @@ def process_and_move_file(file_path, vault_path, daily_notes_path):
                 try:
                     creation_date = datetime.fromisoformat(creation_date_str)
                     year_dir = os.path.join(daily_notes_path, str(creation_date.year))
-                    if not os.path.exists(year_dir):
-                        os.makedirs(year_dir)
-                    
                     new_file_path = os.path.join(year_dir, os.path.basename(file_path))
                     
                     if os.path.abspath(file_path) != os.path.abspath(new_file_path):
-                        shutil.move(file_path, new_file_path)
-                        print(f"Moved daily note: {file_path} to {new_file_path}")
+                        return new_file_path
                     else:
                         print(f"Skipped moving daily note as it's already in the target directory: {file_path}")
 
@@ -69,25 +73,80 @@ def process_and_move_file(file_path, vault_path, daily_notes_path):
 
     except Exception as e:
         print(f"Error processing file {file_path}: {e}")
+    return None
+
 
-def organize(vault_path: str):
+def apply_moves(plan):
+    """
+    Executes a list of (src, dst) moves, sorted by destination.
+    Each target directory is created only once. Returns the moved source paths.
+    """
+    plan = sorted(plan, key=lambda move: move[1])
+    for target_dir in {os.path.dirname(dst) for _, dst in plan}:
+        ensure_dir(target_dir)
+
+    moved = []
+    for file_path, new_file_path in plan:
+        try:
+            move_path(file_path, new_file_path)
+        except OSError as e:
+            print(f"Error moving file {file_path}: {e}")
+            continue
+        print(f"Moved daily note: {file_path} to {new_file_path}")
+        moved.append(file_path)
+    return moved
+
+
+def process_and_move_file(file_path, vault_path, daily_notes_path):
+    """
+    Processes a single Markdown file and moves it to the appropriate directory.
+    Returns the new path if the file was moved, otherwise None.
+    """
+    new_file_path = plan_move(file_path, daily_notes_path)
+    if new_file_path and apply_moves([(file_path, new_file_path)]):
+        return new_file_path
+    return None
+
+def organize(vault_path: str, dry_run: bool = False):
     """
     Organizes files in the vault by moving them to the appropriate directories.
+    Plans all moves first (in parallel), then applies them in one pass.
+    With dry_run the plan is only printed.
     """
     print(f"Organizing vault at: {vault_path}")
     
     daily_notes_path = os.path.join(vault_path, 'daily')
-    if not os.path.exists(daily_notes_path):
+    if not dry_run and not os.path.exists(daily_notes_path):
         os.makedirs(daily_notes_path)
         print(f"Created directory: {daily_notes_path}")
 
-    for root, _, files in os.walk(vault_path):
-        if '.git' in root or '.obsidian' in root:
-            continue
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            if should_process_file(file_path, vault_path):
-                process_and_move_file(file_path, vault_path, daily_notes_path)
+    # Vault-Präfix einmal bestimmen, statt os.path.relpath (abspath + normpath) pro Datei
+    vault_root = os.path.normpath(vault_path)
+    prefix_len = len(os.path.join(vault_root, ''))
+    file_paths = [
+        file_path for file_path in iter_md(vault_root, ignore_case=True)
+        if _should_process_relative(file_path[prefix_len:])
+    ]
+
+    targets = process_parallel(
+        partial(plan_move, daily_notes_path=daily_notes_path),
+        file_paths,
+    )
+    plan = [(src, dst) for src, dst in zip(file_paths, targets) if dst]
+
+    if dry_run:
+        # Eine Zeile pro Datei, aber ein write() statt print() pro Zeile
+        sys.stdout.write("".join(f"[DRY] {src} → {dst}\n" for src, dst in plan))
+        return plan
+
+    moved = apply_moves(plan)
+
+    # Cache-Einträge der alten Pfade verwerfen, im Cache dieses Vaults (falls es einen gibt)
+    cache.use_vault(vault_root)
+    if os.path.exists(cache.CACHE_PATH):
+        for file_path in moved:
+            cache.invalidate(file_path)
+        cache.close()
 
-    print("Vault organization complete.")
\ No newline at end of file
+    print("Vault organization complete.")
+    return plan
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Vergibt Tags in einem einzigen Durchlauf durch den Vault.
+
+Kombiniert auto_tags (Keyword-Regeln), people_extractor (#person) und
+project_extractor (#project): jede Notiz wird nur einmal gelesen, geparst
+und höchstens einmal geschrieben.
+"""
+import hashlib
+from functools import partial
+
+import frontmatter
+
+from secondbrain import cache
+from secondbrain.auto_tags import VAULT, load_rules, match_tags, normalize_rules
+from secondbrain.generators.people_extractor import detect_people
+from secondbrain.generators.project_extractor import detect_project
+from secondbrain.vault_io import iter_md, load_fm, process_parallel, split_fm, tag_list, write_bytes, write_parallel
+
+# Bei Änderungen an den Detektoren erhöhen, damit der Cache neu bewertet
+PIPELINE_VERSION = 1
+
+# Cache-Art für die geparsten Kopfdaten (tags, summary) samt Beginn des Inhalts
+MEMO_KIND = "tag_pipeline_fm"
+
+
+def _tag_note(path, rules, memo=None):
+    """Liefert (neuer Notiz-Text oder None, Memo der Kopfdaten).
+
+    Mit gültigem `memo` wird der YAML-Block nicht erneut geparst, sondern nur der
+    Inhalt ab dem gespeicherten Offset gelesen.
+    """
+    data = None
+    if memo is None:
+        with open(path, "rb") as fh:
+            data = fh.read()
+        header, body = split_fm(data)
+        meta = load_fm(header)
+        memo = {
+            "meta": {k: meta[k] for k in ("tags", "summary") if k in meta},
+            "offset": len(data) - len(body),
+        }
+    else:
+        with open(path, "rb") as fh:
+            fh.seek(memo["offset"])
+            body = fh.read()
+        meta = memo["meta"]
+
+    tags = set(str(t).lower() for t in tag_list(meta.get("tags")))
+
+    if not body.isascii():
+        body = body.decode("utf-8")
+
+    tags |= match_tags(body, rules)
+    if detect_people(body):
+        tags.add("person")
+    if detect_project(meta):
+        tags.add("project")
+
+    new_tags = sorted(tags)
+    if meta.get("tags") == new_tags:
+        return None, memo
+
+    if data is None:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    post = frontmatter.loads(data.decode("utf-8"))
+    post["tags"] = new_tags
+    return frontmatter.dumps(post), memo
+
+
+def _tag_item(item, rules):
+    path, memo = item
+    return _tag_note(path, rules, memo)
+
+
+def _process_file(path, rules):
+    text, _memo = _tag_note(path, rules)
+    if text is not None:
+        write_bytes(path, text.encode("utf-8"))
+
+
+def main():
+    rules = normalize_rules(load_rules())
+
+    print(f"🏷  Tag-Pipeline (Regeln, Personen, Projekte) für Vault: {VAULT}")
+
+    fingerprint = hashlib.sha1(repr((PIPELINE_VERSION, rules)).encode("utf-8")).hexdigest()
+    paths = [p for p in iter_md(VAULT) if cache.lookup(p, "tag_pipeline") != fingerprint]
+
+    memos = [cache.lookup(p, MEMO_KIND) for p in paths]
+    results = process_parallel(partial(_tag_item, rules=rules), zip(paths, memos))
+    write_parallel((p, text) for p, (text, _memo) in zip(paths, results))
+
+    for p, (text, memo) in zip(paths, results):
+        # Umgeschriebene Notizen haben einen neuen Kopf: Memo erst beim nächsten Lauf
+        if text is None:
+            cache.store(p, memo, MEMO_KIND)
+        cache.store(p, fingerprint, "tag_pipeline")
+    cache.prune()
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Gemeinsame Datei-Helfer für die Vault-Scripts.
+"""
+import errno
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+import yaml
+
+# libyaml-Loader, falls PyYAML damit gebaut wurde
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Unterhalb dieser Anzahl lohnt sich der Start eines Prozess-Pools nicht
+PARALLEL_MIN_FILES = 32
+
+# Threads für reine Lesezugriffe (I/O-gebunden, read() gibt die GIL frei)
+READ_WORKERS = 32
+
+# Threads für das Zurückschreiben geänderter Notizen
+WRITE_WORKERS = 8
+
+# System-Ordner, die beim Durchlaufen des Vaults übersprungen werden
+SKIP_DIRS = frozenset({".obsidian", ".trash", ".git", ".smart-env"})
+
+# Gleiche Begrenzung wie frontmatter.YAMLHandler, nur auf Bytes
+_FM_BOUNDARY = re.compile(rb"^-{3,}\s*$", re.MULTILINE)
+
+
+def iter_md(root, ignore_case=False):
+    """Liefert die Pfade (str) aller .md-Dateien unterhalb von `root`.
+
+    Nutzt os.scandir, sodass Ordner/Datei-Typ aus dem Verzeichniseintrag kommen
+    und kein zusätzlicher stat() pro Eintrag nötig ist. Mit `ignore_case` zählen
+    auch Endungen wie .MD oder .Md.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        if e.name not in SKIP_DIRS:
+                            stack.append(e.path)
+                    elif (e.name.lower() if ignore_case else e.name).endswith(".md") and e.is_file():
+                        yield e.path
+        except OSError:
+            continue
+
+
+def count_md(root) -> int:
+    """Zählt die .md-Dateien unterhalb von `root`, ohne Path-Objekte anzulegen."""
+    return sum(1 for _ in iter_md(root))
+
+
+def note_stem(path) -> str:
+    """Dateiname ohne Endung (wie Path.stem), ohne ein Path-Objekt anzulegen."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def split_fm(data: bytes):
+    """Trennt eine Notiz (Bytes) in YAML-Block und Inhalt; ohne Frontmatter ist der YAML-Block leer."""
+    text = data.lstrip()
+    start = _FM_BOUNDARY.match(text)
+    if start:
+        end = _FM_BOUNDARY.search(text, start.end())
+        if end:
+            return text[start.end():end.start()], text[end.end():]
+    return b"", data
+
+
+def load_fm(header: bytes) -> dict:
+    """Parst einen mit split_fm() abgetrennten YAML-Block."""
+    meta = yaml.load(header, Loader=SafeLoader) if header else None
+    return meta if isinstance(meta, dict) else {}
+
+
+def tag_list(value) -> list:
+    """`tags` aus dem Frontmatter als Liste: leerer Schlüssel (None) ergibt [], ein Einzelwert [Wert]."""
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def read_fm_header(path, limit: int = 8192) -> bytes:
+    """Liest nur den (ungeparsten) YAML-Block einer Notiz; ohne Frontmatter b"".
+
+    Zunächst werden `limit` Bytes gelesen; endet der Block dort nicht sicher,
+    wird der Rest der Datei nachgeladen.
+    """
+    with open(path, "rb") as fh:
+        head = fh.read(limit).lstrip()
+        start = _FM_BOUNDARY.match(head)
+        if not start:
+            return b""
+        end = _FM_BOUNDARY.search(head, start.end())
+        if not end or end.end() == len(head):
+            # Header evtl. länger als `limit` oder mitten in der Zeile abgeschnitten
+            head += fh.read()
+            end = _FM_BOUNDARY.search(head, start.end())
+            if not end:
+                return b""
+
+    return head[start.end():end.start()]
+
+
+def read_fm(path, limit: int = 8192) -> dict:
+    """Liest nur den YAML-Frontmatter-Block einer Notiz, nicht den ganzen Inhalt.
+
+    Liefert ein leeres Dict, wenn die Datei keinen Frontmatter-Block hat.
+    """
+    return load_fm(read_fm_header(path, limit))
+
+
+@lru_cache(maxsize=256)
+def _makedirs_once(path: str):
+    os.makedirs(path, exist_ok=True)
+
+
+def ensure_dir(path):
+    """Legt einen Ordner (samt Eltern) an; pro Lauf nur einmal je Pfad, danach ohne Syscall."""
+    _makedirs_once(os.fspath(path))
+    return path
+
+
+def move_path(src, dst):
+    """Verschiebt eine Datei oder einen Ordner per os.replace (ein Syscall).
+
+    Nur wenn Quelle und Ziel auf verschiedenen Dateisystemen liegen, wird auf
+    shutil.move (Kopieren + Löschen) zurückgefallen.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def process_parallel(func, paths, chunksize: int = 64) -> list:
+    """Wendet `func` auf alle Pfade an, bei vielen Dateien über einen Prozess-Pool."""
+    paths = list(paths)
+    if len(paths) < PARALLEL_MIN_FILES:
+        return [func(p) for p in paths]
+
+    # Der Prozess-Pool lädt multiprocessing, das Läufe unter PARALLEL_MIN_FILES nie brauchen
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        return list(ex.map(func, paths, chunksize=chunksize))
+
+
+def read_parallel(func, paths) -> list:
+    """Wendet eine lesende `func` über einen Thread-Pool auf alle Pfade an (Reihenfolge bleibt erhalten)."""
+    paths = list(paths)
+    if len(paths) < 2:
+        return [func(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as ex:
+        return list(ex.map(func, paths))
+
+
+def write_bytes(path, data: bytes):
+    """Schreibt Bytes direkt über den Dateideskriptor, ohne TextIOWrapper und Puffer-Kopien."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_if_changed(path, text: str) -> bool:
+    """Schreibt `text` nur, wenn sich der Dateiinhalt dadurch ändert; liefert True, wenn geschrieben wurde.
+
+    Bei gleicher Größe wird der alte Inhalt verglichen, sonst direkt geschrieben.
+    Unveränderte Dateien behalten so ihre mtime (Cache, Obsidian-Sync).
+    """
+    data = text.encode("utf-8")
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as fh:
+                if fh.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    write_bytes(path, data)
+    return True
+
+
+def _write_text(path, text):
+    write_bytes(path, text.encode("utf-8"))
+
+
+def write_parallel(items) -> int:
+    """Schreibt (Pfad, Text)-Paare über einen begrenzten Thread-Pool; Einträge mit Text None werden übersprungen.
+
+    Liefert die Anzahl geschriebener Dateien. Fehler einzelner Schreibvorgänge werden weitergereicht.
+    """
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as ex:
+        futures = [ex.submit(_write_text, path, text) for path, text in items if text is not None]
+        for fut in as_completed(futures):
+            fut.result()
+    return len(futures)
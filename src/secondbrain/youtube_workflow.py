@@ -4,11 +4,37 @@ YouTube zu Obsidian Workflow mit Fabric AI.
 Extrahiert Transkripte, Kommentare und Metadaten und erstellt Notizen.
 """
 import os
+import re
+import shutil
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
-import frontmatter
+
+from secondbrain.vault_io import ensure_dir, write_bytes
+
+# Alles außer Buchstaben, Ziffern, Leerzeichen, '-' und '_' (\w entspricht str.isalnum() plus '_')
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w \-]")
+
+# Maximale Transkript-Länge für die AI-Zusammenfassung (konservativ wegen API-Limits)
+MAX_SUMMARY_CHARS = 4000
+
+# Erste Zeile mit "TAGS" und die darauf folgende Zeile (enthält die Tags)
+_TAGS_LINE_RE = re.compile(r"^[^\n]*TAGS[^\n]*\n([^\n]*)", re.MULTILINE)
+
+# Gleichzeitige Transkript-Downloads bei mehreren URLs
+FETCH_WORKERS = 4
+
+# Größerer Pipe-Puffer für fabric (Linux, sonst ignoriert): lange Transkripte
+# brauchen weniger Schreib/Lese-Wechsel zwischen den Prozessen
+FABRIC_PIPE_SIZE = 1 << 18
+
+FABRIC_MISSING = "❌ Fabric ist nicht installiert. Bitte installiere es mit: go install github.com/danielmiessler/fabric@latest"
+
+# Video-ID aus watch?v=, youtu.be/, /embed/ und /shorts/ URLs
+_YOUTUBE_ID_RE = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/(?:embed|shorts)/)([^&\n?#]+)')
 
 
 def get_vault_path():
@@ -17,64 +43,108 @@ def get_vault_path():
     return Path(vault).expanduser().resolve()
 
 
+@lru_cache(maxsize=None)
+def find_command(cmd: str):
+    """Sucht ein Programm einmal im PATH und liefert den absoluten Pfad (oder None)."""
+    return shutil.which(cmd)
+
+
+def has_command(cmd: str) -> bool:
+    """Prüft per PATH-Suche (ohne Prozessstart), ob ein Programm installiert ist."""
+    return find_command(cmd) is not None
+
+
+def safe_filename(title: str) -> str:
+    """Ersetzt Zeichen, die in Dateinamen Probleme machen, durch '_'."""
+    # Schneller Pfad: reine Buchstaben/Ziffern (z.B. Video-IDs) brauchen keinen Regex-Lauf
+    if title.isalnum():
+        return title
+    return _UNSAFE_FILENAME_RE.sub("_", title)
+
+
 def extract_youtube_id(url: str) -> str:
     """Extrahiert die YouTube Video-ID aus der URL."""
-    import re
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\n?#]+)',
-        r'youtube\.com/embed/([^&\n?#]+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = _YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _run_fabric(args: list, input_text: str = None) -> str:
+    """Führt einen Fabric-Befehl ohne eigene Ausgaben aus; Fehler werden geworfen."""
+    # Absoluter Pfad: exec muss nicht bei jedem Aufruf alle PATH-Ordner durchprobieren
+    cmd = [find_command("fabric") or "fabric"] + args
+    
+    # Inhalt direkt über stdin übergeben (auch leerer Text, sonst würde
+    # Fabric auf dem Terminal-stdin warten). Ein- und Ausgabe als Bytes,
+    # die Ausgabe wird einmal am Ende dekodiert statt über TextIOWrapper.
+    # close_fds=False (mit absolutem Pfad) lässt subprocess posix_spawn statt
+    # fork+exec nutzen; Python-Dateideskriptoren werden ohnehin nicht vererbt
+    result = subprocess.run(
+        cmd,
+        input=input_text.encode("utf-8") if input_text is not None else None,
+        capture_output=True,
+        pipesize=FABRIC_PIPE_SIZE,
+        close_fds=False,
+        check=True
+    )
+    return result.stdout.decode("utf-8", errors="replace")
+
+
+def _fabric_error(e: subprocess.CalledProcessError) -> str:
+    error_msg = e.stderr.decode("utf-8", errors="replace").strip() if e.stderr else str(e)
+    return f"❌ Fabric Fehler: {error_msg}"
 
 
 def run_fabric_command(args: list, input_text: str = None, raise_on_error: bool = False) -> str:
     """Führt einen Fabric-Befehl aus."""
-    cmd = ["fabric"] + args
-    
     try:
-        if input_text:
-            result = subprocess.run(
-                cmd,
-                input=input_text,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        else:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-        return result.stdout
+        return _run_fabric(args, input_text)
     except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.strip() if e.stderr else str(e)
-        print(f"❌ Fabric Fehler: {error_msg}")
+        print(_fabric_error(e))
         if raise_on_error:
             raise
         return None
     except FileNotFoundError:
-        print("❌ Fabric ist nicht installiert. Bitte installiere es mit: go install github.com/danielmiessler/fabric@latest")
+        print(FABRIC_MISSING)
         sys.exit(1)
 
 
-def get_youtube_transcript(url: str, with_timestamps: bool = False) -> str:
-    """Holt das Transkript von YouTube mit Fabric."""
-    print(f"📥 Lade Transkript von YouTube...")
-    
-    # Fabric nutzt -y flag für YouTube URL, gibt direkt das Transkript zurück
-    args = ["-y", url]
-    
-    transcript = run_fabric_command(args, raise_on_error=False)
+def fetch_transcript(url: str, with_timestamps: bool = False):
+    """Lädt das Transkript ohne eigene Ausgaben.
+
+    Liefert (Transkript, Meldungen); die Meldungen gibt der Aufrufer beim
+    zugehörigen Video aus. Bei Fehlern ist das Transkript leer.
+    """
+    messages = []
+    try:
+        # Fabric nutzt -y flag für YouTube URL, gibt direkt das Transkript zurück
+        transcript = _run_fabric(["-y", url])
+    except subprocess.CalledProcessError as e:
+        transcript = ""
+        messages.append(_fabric_error(e))
     if not transcript:
-        print("⚠️  Warnung: Transkript konnte nicht geladen werden")
-        return ""
-    return transcript
+        messages.append("⚠️  Warnung: Transkript konnte nicht geladen werden")
+    return transcript, messages
+
+
+def _load_transcript(url: str, with_timestamps: bool = False):
+    """fetch_transcript für den Thread-Pool: unerwartete Fehler werden zurückgegeben statt geworfen."""
+    try:
+        return fetch_transcript(url, with_timestamps)
+    except Exception as e:
+        return e
+
+
+def prefetch_transcripts(urls: list, with_timestamps: bool = False) -> dict:
+    """Lädt die Transkripte mehrerer Videos gleichzeitig; jeder fabric-Aufruf wartet nur auf das Netz.
+
+    Gibt nichts aus; pro URL kommt (Transkript, Meldungen) oder die aufgetretene Exception zurück.
+    """
+    urls = list(dict.fromkeys(urls))
+    load = partial(_load_transcript, with_timestamps=with_timestamps)
+    if len(urls) < 2:
+        return {url: load(url) for url in urls}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        return dict(zip(urls, ex.map(load, urls)))
 
 
 def get_youtube_metadata(url: str) -> dict:
@@ -96,17 +166,27 @@ def apply_fabric_pattern(content: str, pattern: str) -> str:
     return result if result else ""
 
 
+def parse_tags(result: str) -> list:
+    """Liest bis zu 8 Tags aus der Zeile nach der TAGS-Überschrift einer AI-Zusammenfassung."""
+    if '🏷️ TAGS' not in result and '## TAGS' not in result:
+        return []
+    # Nur die Tag-Zeile wird zerlegt, nicht das ganze Ergebnis
+    match = _TAGS_LINE_RE.search(result)
+    if not match:
+        return []
+    tags = (t.strip() for t in match.group(1).split(','))
+    return [t.lower().replace(' ', '-') for t in tags if t][:8]
+
+
 def create_structured_summary(transcript: str) -> dict:
     """Erstellt eine strukturierte Zusammenfassung mit einem Custom AI-Pattern."""
     print("\n📊 Erstelle strukturierte Zusammenfassung mit AI...")
     
-    # Truncate transcript wenn zu lang (API Limits)
-    max_chars = 4000  # Konservativer Wert für API Limits
-    truncated = False
-    if len(transcript) > max_chars:
-        print(f"  ⚠️  Transkript zu lang ({len(transcript)} Zeichen), kürze auf {max_chars} Zeichen...")
-        transcript = transcript[:max_chars] + "\n\n[... Rest des Transkripts gekürzt ...]"
-        truncated = True
+    # Truncate transcript wenn zu lang (API Limits); kurze Transkripte werden nicht kopiert
+    truncated = len(transcript) > MAX_SUMMARY_CHARS
+    if truncated:
+        print(f"  ⚠️  Transkript zu lang ({len(transcript)} Zeichen), kürze auf {MAX_SUMMARY_CHARS} Zeichen...")
+        transcript = f"{transcript[:MAX_SUMMARY_CHARS]}\n\n[... Rest des Transkripts gekürzt ...]"
     
     # Nutze das Custom Pattern für Video-Zusammenfassungen
     print("  → Applying extract_video_summary pattern...")
@@ -130,15 +210,7 @@ def create_structured_summary(transcript: str) -> dict:
     }
     
     # Extrahiere Tags aus dem Ergebnis
-    if '🏷️ TAGS' in result or '## TAGS' in result:
-        lines = result.split('\n')
-        for i, line in enumerate(lines):
-            if 'TAGS' in line and i + 1 < len(lines):
-                # Nächste Zeile enthält die Tags
-                tags_line = lines[i + 1].strip()
-                tags = [t.strip() for t in tags_line.split(',')]
-                summary['tags'] = [t.lower().replace(' ', '-') for t in tags if t][:8]
-                break
+    summary['tags'] = parse_tags(result)
     
     print(f"  ✅ AI-Zusammenfassung erstellt ({len(result)} Zeichen)")
     return summary
@@ -148,10 +220,11 @@ def create_youtube_note(vault_path: Path, url: str, transcript: str,
                        metadata: dict, pattern: str = None, title: str = None,
                        use_ai_structure: bool = False):
     """Erstellt eine Obsidian-Notiz für ein YouTube-Video."""
+    # python-frontmatter braucht nur das Schreiben der Notiz, nicht --list-patterns
+    import frontmatter
     
     # Ordner für YouTube-Notizen
-    youtube_dir = vault_path / "03_Resources" / "YouTube"
-    youtube_dir.mkdir(parents=True, exist_ok=True)
+    youtube_dir = ensure_dir(vault_path / "03_Resources" / "YouTube")
     
     # Titel bestimmen
     if not title:
@@ -160,7 +233,7 @@ def create_youtube_note(vault_path: Path, url: str, transcript: str,
     
     # Dateiname
     date_stamp = datetime.now().strftime("%Y-%m-%d")
-    safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
+    safe_title = safe_filename(title)
     filename = f"{date_stamp}-{safe_title}.md"
     filepath = youtube_dir / filename
     
@@ -201,39 +274,39 @@ def create_youtube_note(vault_path: Path, url: str, transcript: str,
         if "views" in metadata:
             post.metadata["views"] = metadata["views"]
     
-    # Content zusammensetzen
-    content = f"""# {title}
+    # Content zusammensetzen: Teile sammeln und einmal verbinden, statt den
+    # (evtl. langen) Transkript-String mehrfach per += zu kopieren
+    parts = [f"""# {title}
 
 ## 📺 Video Info
 
 - **URL**: {url}
 - **Date**: {date_stamp}
-"""
+"""]
     
     if metadata:
         if "channel" in metadata:
-            content += f"- **Channel**: {metadata.get('channel', 'N/A')}\n"
+            parts.append(f"- **Channel**: {metadata.get('channel', 'N/A')}\n")
         if "duration" in metadata:
-            content += f"- **Duration**: {metadata.get('duration', 'N/A')}\n"
+            parts.append(f"- **Duration**: {metadata.get('duration', 'N/A')}\n")
     
     # AI-Zusammenfassung hinzufügen
     if ai_summary and ai_summary.get('content'):
-        content += "\n## 🤖 AI Zusammenfassung\n\n"
+        parts.append("\n## 🤖 AI Zusammenfassung\n\n")
         if ai_summary.get('truncated'):
-            content += "> ⚠️ *Hinweis: Aufgrund der Länge wurde nur der Anfang des Transkripts für die AI-Analyse verwendet.*\n\n"
-        content += ai_summary['content'] + "\n\n"
-        content += "---\n\n"
+            parts.append("> ⚠️ *Hinweis: Aufgrund der Länge wurde nur der Anfang des Transkripts für die AI-Analyse verwendet.*\n\n")
+        parts += (ai_summary['content'], "\n\n", "---\n\n")
     
-    content += "\n## 📝 Vollständiges Transkript\n\n"
-    content += processed_content if not use_ai_structure else transcript
-    
-    content += "\n\n## 🔗 Related\n\n"
+    parts += (
+        "\n## 📝 Vollständiges Transkript\n\n",
+        processed_content if not use_ai_structure else transcript,
+        "\n\n## 🔗 Related\n\n",
+    )
     
-    post.content = content
+    post.content = "".join(parts)
     
     # Speichern
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(frontmatter.dumps(post))
+    write_bytes(filepath, frontmatter.dumps(post).encode("utf-8"))
     
     print(f"\n✅ Notiz erstellt: {filepath.relative_to(vault_path)}")
     return filepath
@@ -295,6 +368,11 @@ Beispiele:
     
     args = parser.parse_args()
     
+    # Einmal vorab prüfen statt erst beim ersten Video abzubrechen
+    if (args.list_patterns or args.urls) and not has_command("fabric"):
+        print(FABRIC_MISSING)
+        sys.exit(1)
+    
     # Liste Patterns
     if args.list_patterns:
         print("🎨 Verfügbare Fabric Patterns:\n")
@@ -305,6 +383,11 @@ Beispiele:
             print("Keine Patterns gefunden. Führe 'fabric --setup' aus.")
         return
     
+    # Ohne URL gibt es nichts zu tun: Hilfe zeigen, ohne Vault-Prüfung
+    if not args.urls:
+        parser.print_help()
+        return
+    
     vault_path = get_vault_path()
     
     if not vault_path.exists():
@@ -315,6 +398,12 @@ Beispiele:
     print(f"\n🎬 YouTube zu Obsidian Workflow")
     print(f"📁 Vault: {vault_path}\n")
     
+    # Transkripte vorab parallel laden, die Notizen entstehen danach der Reihe nach
+    print("📥 Lade Transkripte von YouTube...")
+    transcripts = prefetch_transcripts(
+        [url for url in args.urls if extract_youtube_id(url)], args.timestamps
+    )
+    
     for i, url in enumerate(args.urls, 1):
         print(f"\n{'='*60}")
         print(f"Video {i}/{len(args.urls)}: {url}")
@@ -327,8 +416,13 @@ Beispiele:
             continue
         
         try:
-            # Transkript holen
-            transcript = get_youtube_transcript(url, args.timestamps)
+            # Meldungen zum bereits geladenen Transkript bei diesem Video ausgeben
+            loaded = transcripts[url]
+            if isinstance(loaded, Exception):
+                raise loaded
+            transcript, messages = loaded
+            for message in messages:
+                print(message)
             
             # Auch bei leerem Transkript fortfahren (Notiz ohne Content)
             # Metadaten holen
@@ -0,0 +1,114 @@
+import frontmatter
+import pytest
+
+from secondbrain import auto_tags, cache
+from secondbrain.auto_tags import _automaton, _process_file, match_tags, normalize_rules
+
+
+def test_normalize_rules_skips_incomplete_rules():
+    rules = [
+        {"tag": "AI", "keywords": ["PyTorch", "LLM"]},
+        {"tag": "empty", "keywords": []},
+        {"keywords": ["orphan"]},
+    ]
+    assert normalize_rules(rules) == (("ai", ("pytorch", "llm")),)
+
+
+def test_process_file_adds_matching_tags(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("---\ntags: [Misc]\n---\nTraining a YOLO model with pytorch.\n", encoding="utf-8")
+
+    rules = normalize_rules([
+        {"tag": "ai", "keywords": ["PyTorch"]},
+        {"tag": "obsidian", "keywords": ["Dataview"]},
+    ])
+    _process_file(note, rules)
+
+    post = frontmatter.load(note)
+    assert post["tags"] == ["ai", "misc"]
+
+
+def test_match_tags_handles_shared_keywords():
+    rules = (("project", ("deadline", "sprint")), ("agile", ("sprint",)))
+    assert match_tags("Next Sprint starts monday", rules) == {"project", "agile"}
+    assert match_tags("nothing to see", rules) == set()
+
+
+def test_process_file_skips_unchanged_notes(tmp_path):
+    note = tmp_path / "note.md"
+    original = "---\ntags:\n- ai\n---\n\nPyTorch notes, unusual   spacing kept.\n"
+    note.write_text(original, encoding="utf-8")
+
+    _process_file(note, normalize_rules([{"tag": "ai", "keywords": ["pytorch"]}]))
+
+    assert note.read_text(encoding="utf-8") == original
+
+
+def test_process_file_tolerates_empty_or_scalar_tags(tmp_path):
+    rules = normalize_rules([{"tag": "ai", "keywords": ["pytorch"]}])
+    note = tmp_path / "note.md"
+
+    note.write_text("---\ntags:\n---\nnur text.\n", encoding="utf-8")
+    _process_file(note, rules)
+    assert frontmatter.load(note)["tags"] == []
+
+    note.write_text("---\ntags: misc\n---\nPyTorch notes.\n", encoding="utf-8")
+    _process_file(note, rules)
+    assert frontmatter.load(note)["tags"] == ["ai", "misc"]
+
+
+def test_match_tags_on_ascii_bytes():
+    rules = normalize_rules([{"tag": "ai", "keywords": ["PyTorch", "Gefühl"]}])
+    assert match_tags(b"we use PYTORCH here", rules) == {"ai"}
+    assert match_tags(b"nothing here", rules) == set()
+
+
+def test_match_tags_uses_one_matcher_for_bytes_and_str():
+    pytest.importorskip("ahocorasick")
+    rules = normalize_rules([{"tag": "ml", "keywords": ["learn", "deep learning"]}, {"tag": "ai", "keywords": ["deep"]}])
+    _automaton.cache_clear()
+
+    text = "Deep Learning basics"
+    assert match_tags(text.encode("ascii"), rules) == match_tags(text, rules) == {"ml", "ai"}
+    assert _automaton.cache_info().hits == 1
+
+
+def test_process_file_ignores_keywords_in_frontmatter(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("---\ntitle: Obsidian tips\n---\nPlain body.\n", encoding="utf-8")
+
+    _process_file(note, normalize_rules([{"tag": "obsidian", "keywords": ["Obsidian"]}]))
+
+    assert frontmatter.load(note)["tags"] == []
+
+
+def test_normalize_rules_dedupes_keywords_case_insensitively():
+    rules = [{"tag": "Project", "keywords": ["Projekt", "projekt", "Sprint"]}]
+    assert normalize_rules(rules) == (("project", ("projekt", "sprint")),)
+
+
+def test_load_rules_does_not_need_the_vault_cache(tmp_path, monkeypatch):
+    rules_file = tmp_path / "auto_tags.yaml"
+    rules_file.write_text("rules:\n  - tag: ai\n    keywords: [pytorch]\n", encoding="utf-8")
+    monkeypatch.setattr(auto_tags, "RULES_PATH", rules_file)
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "fehlt" / "cache.sqlite")
+    monkeypatch.setattr(cache, "USE_CACHE", True)
+
+    assert auto_tags.load_rules() == [{"tag": "ai", "keywords": ["pytorch"]}]
+    assert cache._conn is None
+
+
+def test_load_rules_parses_again_only_after_file_changes(tmp_path, monkeypatch):
+    rules_file = tmp_path / "auto_tags.yaml"
+    rules_file.write_text("rules:\n  - tag: ai\n    keywords: [pytorch]\n", encoding="utf-8")
+    monkeypatch.setattr(auto_tags, "RULES_PATH", rules_file)
+    auto_tags._parse_rules_cached.cache_clear()
+
+    assert auto_tags.load_rules() == [{"tag": "ai", "keywords": ["pytorch"]}]
+    monkeypatch.setattr(auto_tags, "_parse_rules", lambda path: pytest.fail("not memoized"))
+    assert auto_tags.load_rules() == [{"tag": "ai", "keywords": ["pytorch"]}]
+
+    monkeypatch.undo()
+    monkeypatch.setattr(auto_tags, "RULES_PATH", rules_file)
+    rules_file.write_text("rules:\n  - tag: ml\n    keywords: [sklearn, numpy]\n", encoding="utf-8")
+    assert auto_tags.load_rules() == [{"tag": "ml", "keywords": ["sklearn", "numpy"]}]
@@ -0,0 +1,94 @@
+import pytest
+
+from secondbrain import cache
+
+
+@pytest.fixture
+def tmp_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "cache.sqlite")
+    monkeypatch.setattr(cache, "USE_CACHE", True)
+    yield
+    cache.close()
+
+
+def test_get_or_compute_reuses_entry_until_file_changes(tmp_path, tmp_cache):
+    note = tmp_path / "note.md"
+    note.write_text("v1", encoding="utf-8")
+    calls = []
+
+    def compute(path):
+        calls.append(path)
+        return {"text": path.read_text(encoding="utf-8")}
+
+    assert cache.get_or_compute(note, compute) == {"text": "v1"}
+    assert cache.get_or_compute(note, compute) == {"text": "v1"}
+    assert len(calls) == 1
+
+    note.write_text("v2 longer", encoding="utf-8")
+    assert cache.get_or_compute(note, compute) == {"text": "v2 longer"}
+    assert len(calls) == 2
+
+
+def test_invalidate_drops_all_kinds(tmp_path, tmp_cache):
+    note = tmp_path / "note.md"
+    note.write_text("x", encoding="utf-8")
+    cache.store(note, {"tags": []})
+    cache.store(note, "abc", kind="auto_tags")
+
+    cache.invalidate(note)
+
+    assert cache.lookup(note) is None
+    assert cache.lookup(note, kind="auto_tags") is None
+
+
+def test_get_or_compute_many_keeps_order(tmp_path, tmp_cache):
+    notes = []
+    for i in range(5):
+        note = tmp_path / f"n{i}.md"
+        note.write_text(str(i), encoding="utf-8")
+        notes.append(note)
+    cache.store(notes[2], "cached")
+
+    results = cache.get_or_compute_many(notes, lambda p: p.read_text(encoding="utf-8"))
+
+    assert results == ["0", "1", "cached", "3", "4"]
+
+
+def test_payload_roundtrip_matches_json(tmp_path, tmp_cache):
+    import datetime
+    import json
+
+    note = tmp_path / "note.md"
+    note.write_text("x", encoding="utf-8")
+    payload = {"title": "Ü", 1: "int-key", "date": datetime.date(2024, 3, 1), "big": 2**70, "tags": ("a",)}
+
+    cache.store(note, payload)
+
+    assert cache.lookup(note) == json.loads(json.dumps(payload, default=str))
+
+
+def test_unavailable_database_disables_cache(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "fehlt" / "cache.sqlite")
+    monkeypatch.setattr(cache, "USE_CACHE", True)
+    note = tmp_path / "note.md"
+    note.write_text("x", encoding="utf-8")
+
+    cache.store(note, "abc")
+    cache.invalidate(note)
+    assert cache.lookup(note) is None
+    assert cache.get_or_compute(note, lambda p: "neu") == "neu"
+    assert capsys.readouterr().out.count("Cache nicht verfügbar") == 1
+
+
+def test_missing_file_is_a_miss_and_pruned(tmp_path, tmp_cache):
+    kept, gone = tmp_path / "kept.md", tmp_path / "gone.md"
+    for note in (kept, gone):
+        note.write_text("x", encoding="utf-8")
+        cache.store(note, "abc")
+    gone.unlink()
+
+    assert cache.lookup(gone) is None
+    cache.store(gone, "abc")
+    assert cache.prune() == 1
+    assert cache.prune() == 0
+    assert cache.lookup(kept) == "abc"
@@ -0,0 +1,35 @@
+from secondbrain import cleanup_vault, cleanup_vault_en
+from secondbrain.cleanup_vault import suggest_para_location
+
+
+def test_suggest_para_location_knows_german_and_english_keywords():
+    assert suggest_para_location("Projekt-Dokumente") == "03_Resources"
+    assert suggest_para_location("Team Documentation") == "03_Resources"
+    assert suggest_para_location("sync-tool") == "01_Projects"
+    assert suggest_para_location("IaC") == "02_Areas"
+    assert suggest_para_location("Sonstiges") == "01_Projects"
+
+
+def test_english_module_is_an_alias():
+    assert cleanup_vault_en.main is cleanup_vault.main
+    assert cleanup_vault_en.suggest_para_location is cleanup_vault.suggest_para_location
+
+
+def test_move_folders_prunes_cache_of_moved_notes(tmp_path, monkeypatch):
+    from secondbrain import cache
+
+    monkeypatch.setattr(cache, "CACHE_PATH", cache.CACHE_PATH)
+    monkeypatch.setattr(cache, "USE_CACHE", True)
+    note = tmp_path / "sync-tool" / "plan.md"
+    note.parent.mkdir()
+    note.write_text("x", encoding="utf-8")
+    cache.use_vault(tmp_path)
+    cache.store(note, "abc")
+    cache.close()
+
+    cleanup_vault.move_folders(tmp_path, [note.parent], dry_run=False)
+
+    moved = tmp_path / "01_Projects" / "sync-tool" / "plan.md"
+    assert moved.exists()
+    with cache.sqlite3.connect(tmp_path / cache.CACHE_NAME) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM entries").fetchone() == (0,)
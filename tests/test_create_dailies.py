@@ -0,0 +1,56 @@
+from datetime import datetime
+from pathlib import Path
+
+import frontmatter
+import pytest
+
+from secondbrain.create_dailies import add_link_to_daily, add_links_to_daily, create_daily_note, scan_recent_files
+
+
+def test_add_links_to_daily_matches_single_link_calls(tmp_path):
+    date = datetime(2024, 3, 1)
+    batch = create_daily_note(tmp_path / "a", date)
+    single = create_daily_note(tmp_path / "b", date)
+    files = [Path("Projekt.md"), Path("Idee.md"), Path("Projekt.md")]
+
+    add_links_to_daily(batch, files)
+    for f in files:
+        add_link_to_daily(single, f)
+
+    content = frontmatter.load(batch).content
+    assert content == frontmatter.load(single).content
+    assert content.count("- [[Projekt]]") == 1
+    assert content.index("- [[Projekt]]") < content.index("- [[Idee]]") < content.index("## 💭 Reflections")
+
+
+def test_scan_recent_files_skips_daily_and_index(tmp_path):
+    (tmp_path / "Daily" / "2024").mkdir(parents=True)
+    (tmp_path / "Daily" / "2024" / "2024-03-01.md").write_text("")
+    (tmp_path / "Index.md").write_text("")
+    (tmp_path / "Projekt.md").write_text("")
+
+    recent = scan_recent_files(tmp_path, days=1)
+
+    assert [f for files in recent.values() for f in files] == [tmp_path / "Projekt.md"]
+
+
+def test_create_daily_note_keeps_existing_note(tmp_path):
+    date = datetime(2024, 3, 1)
+    path = create_daily_note(tmp_path, date)
+    path.write_text("eigene Notiz", encoding="utf-8")
+
+    assert create_daily_note(tmp_path, date) == path
+    assert path.read_text(encoding="utf-8") == "eigene Notiz"
+
+
+def test_create_daily_note_leaves_no_empty_file_on_error(tmp_path, monkeypatch):
+    def broken_dumps(post):
+        raise ValueError("kaputt")
+
+    monkeypatch.setattr(frontmatter, "dumps", broken_dumps)
+    date = datetime(2024, 3, 1)
+
+    with pytest.raises(ValueError):
+        create_daily_note(tmp_path, date)
+
+    assert not (tmp_path / "Daily" / "2024" / "2024-03-01.md").exists()
@@ -0,0 +1,31 @@
+import frontmatter
+
+from secondbrain.generators import people_extractor, project_extractor
+
+
+def _note(tmp_path, text):
+    note = tmp_path / "note.md"
+    note.write_text(text, encoding="utf-8")
+    return note
+
+
+def test_extractors_skip_notes_with_empty_tags_and_no_match(tmp_path):
+    note = _note(tmp_path, "---\ntags:\nsummary: nothing\n---\nHello world, no names here.\n")
+    assert people_extractor._tag_note(note) is None
+    assert project_extractor._tag_note(note) is None
+
+
+def test_extractors_accept_none_and_scalar_tags(tmp_path):
+    note = _note(tmp_path, "---\ntags:\nsummary: next milestone\n---\nMeeting with Anton Feldmann.\n")
+    assert frontmatter.loads(people_extractor._tag_note(note))["tags"] == ["person"]
+    assert frontmatter.loads(project_extractor._tag_note(note))["tags"] == ["project"]
+
+    note = _note(tmp_path, "---\ntags: misc\nsummary: next milestone\n---\nMeeting with Anton Feldmann.\n")
+    assert frontmatter.loads(people_extractor._tag_note(note))["tags"] == ["misc", "person"]
+    assert frontmatter.loads(project_extractor._tag_note(note))["tags"] == ["misc", "project"]
+
+
+def test_extractors_leave_unsorted_but_complete_tags_alone(tmp_path):
+    note = _note(tmp_path, "---\ntags: [zeta, project, person]\nsummary: deadline\n---\nAnton Feldmann\n")
+    assert people_extractor._tag_note(note) is None
+    assert project_extractor._tag_note(note) is None
@@ -3,3 +3,14 @@ from secondbrain.translator import translate_markdown
 def test_translation_passthrough():
     text = "# Title\n\n```python\nprint('hi')\n```"
     assert translate_markdown(text) == text
+
+def test_read_markdown_falls_back_to_latin1(tmp_path):
+    from secondbrain.ingest import read_markdown
+
+    utf8 = tmp_path / "utf8.md"
+    utf8.write_bytes("# Grüße\r\ntext\r".encode("utf-8"))
+    assert read_markdown(utf8) == "# Grüße\ntext\n"
+
+    latin1 = tmp_path / "latin1.md"
+    latin1.write_bytes("# Grüße\n".encode("latin-1"))
+    assert read_markdown(latin1) == "# Grüße\n"
@@ -0,0 +1,34 @@
+from secondbrain.init_vault import create_para_structure
+
+PARA = ["01_Projects", "02_Areas", "03_Resources", "04_Archive"]
+
+
+def test_create_para_structure_only_creates_missing_folders(tmp_path, capsys):
+    (tmp_path / "02_Areas").mkdir()
+    (tmp_path / "02_Areas" / "note.md").write_text("bleibt", encoding="utf-8")
+
+    create_para_structure(tmp_path)
+
+    out = capsys.readouterr().out
+    assert "✓ 02_Areas existiert bereits" in out
+    assert "✓ 01_Projects erstellt" in out
+    assert all((tmp_path / f / ".gitkeep").is_file() for f in PARA)
+    assert (tmp_path / "02_Areas" / "note.md").read_text(encoding="utf-8") == "bleibt"
+
+
+def test_create_para_structure_dry_run_touches_nothing(tmp_path):
+    create_para_structure(tmp_path, dry_run=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_create_para_structure_creates_missing_vault(tmp_path):
+    vault = tmp_path / "neu" / "Vault"
+    create_para_structure(vault)
+    assert sorted(p.name for p in vault.iterdir()) == PARA
+
+
+def test_create_para_structure_keeps_existing_gitkeep(tmp_path):
+    (tmp_path / "01_Projects").mkdir()
+    (tmp_path / "01_Projects" / ".gitkeep").write_text("x", encoding="utf-8")
+    create_para_structure(tmp_path)
+    assert (tmp_path / "01_Projects" / ".gitkeep").read_text(encoding="utf-8") == "x"
@@ -0,0 +1,21 @@
+from secondbrain.generators.moc_builder import read_title
+
+
+def test_read_title_reads_past_truncated_header(tmp_path):
+    # Die Grenze von `limit` fällt genau hinter ein "---" am Anfang einer längeren Zeile
+    head = "---\nsummary: x\n"
+    note = tmp_path / "note.md"
+    note.write_text(head + "---x: 1\ntitle: Echt\n---\nBody\n", encoding="utf-8")
+
+    assert read_title(note, limit=len(head) + 3) == {"title": "Echt"}
+    assert read_title(note, limit=8) == {"title": "Echt"}
+
+
+def test_read_title_without_title_or_header(tmp_path):
+    plain = tmp_path / "plain.md"
+    plain.write_text("# Nur Text\n", encoding="utf-8")
+    untitled = tmp_path / "untitled.md"
+    untitled.write_text("---\ntags: [a]\n---\n", encoding="utf-8")
+
+    assert read_title(plain) == {}
+    assert read_title(untitled) == {}
@@ -0,0 +1,50 @@
+import sqlite3
+
+from secondbrain import cache
+from secondbrain.organize import organize
+
+
+def test_organize_plans_then_moves_daily_notes(tmp_path, monkeypatch, capsys):
+    # Cache nur für diesen Test umlenken; organize() legt ihn in den übergebenen Vault
+    monkeypatch.setattr(cache, "CACHE_PATH", cache.CACHE_PATH)
+    monkeypatch.setattr(cache, "USE_CACHE", True)
+    note = tmp_path / "inbox" / "2024-03-01.md"
+    note.parent.mkdir()
+    note.write_text("---\ntags: [daily-note]\ncreation_date: '2024-03-01'\n---\nHallo\n", encoding="utf-8")
+    (tmp_path / "other.md").write_text("# Keine Tagesnotiz\n", encoding="utf-8")
+    target = tmp_path / "daily" / "2024" / "2024-03-01.md"
+
+    plan = organize(str(tmp_path), dry_run=True)
+    assert plan == [(str(note), str(target))]
+    assert f"[DRY] {note} → {target}\n" in capsys.readouterr().out
+    assert organize(str(tmp_path) + "/", dry_run=True) == plan
+    assert note.exists() and not (tmp_path / "daily").exists()
+
+    cache.use_vault(tmp_path)
+    cache.store(note, {"tags": ["daily-note"]})
+    cache.close()
+
+    organize(str(tmp_path))
+    assert target.exists() and not note.exists()
+    with sqlite3.connect(tmp_path / cache.CACHE_NAME) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM entries").fetchone() == (0,)
+
+
+def test_organize_ignores_cache_of_other_vault(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "fehlt" / cache.CACHE_NAME)
+    monkeypatch.setattr(cache, "USE_CACHE", True)
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "2024-03-01.md").write_text("---\ntags: [daily-note]\ncreation_date: '2024-03-01'\n---\n", encoding="utf-8")
+
+    organize(str(vault))
+
+    assert (vault / "daily" / "2024" / "2024-03-01.md").exists()
+    assert not (vault / cache.CACHE_NAME).exists()
+
+
+def test_organize_picks_up_uppercase_extension(tmp_path):
+    note = tmp_path / "2024-03-02.MD"
+    note.write_text("---\ntags: [daily-note]\ncreation_date: '2024-03-02'\n---\nHallo\n", encoding="utf-8")
+
+    assert organize(str(tmp_path), dry_run=True) == [(str(note), str(tmp_path / "daily" / "2024" / "2024-03-02.MD"))]
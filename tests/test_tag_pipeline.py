@@ -0,0 +1,64 @@
+import frontmatter
+
+from secondbrain.auto_tags import normalize_rules
+from secondbrain.tag_pipeline import _process_file, _tag_note
+
+
+def test_process_file_applies_all_taggers_in_one_write(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(
+        "---\nsummary: Next milestone in May\ntags: [Misc]\n---\nMeeting with Anton Feldmann about PyTorch.\n",
+        encoding="utf-8",
+    )
+
+    _process_file(note, normalize_rules([{"tag": "ai", "keywords": ["pytorch"]}]))
+
+    assert frontmatter.load(note)["tags"] == ["ai", "misc", "person", "project"]
+
+
+def test_process_file_without_matches_leaves_note_untouched(tmp_path):
+    note = tmp_path / "note.md"
+    original = "---\ntags:\n- misc\n---\n\nnur kleinbuchstaben hier.\n"
+    note.write_text(original, encoding="utf-8")
+
+    _process_file(note, ())
+
+    assert note.read_text(encoding="utf-8") == original
+
+
+def test_process_file_tolerates_null_or_non_string_summary(tmp_path):
+    for summary, expected in (("", ["misc"]), ("2024", ["misc"]), ("[deadline]", ["misc", "project"])):
+        note = tmp_path / "note.md"
+        note.write_text(f"---\nsummary: {summary}\ntags: [misc]\n---\nnur text.\n", encoding="utf-8")
+
+        _process_file(note, normalize_rules([{"tag": "deadline", "keywords": ["deadline"]}]))
+
+        assert frontmatter.load(note)["tags"] == expected
+
+
+def test_process_file_tolerates_empty_or_scalar_tags(tmp_path):
+    rules = normalize_rules([{"tag": "ai", "keywords": ["pytorch"]}])
+    note = tmp_path / "note.md"
+
+    note.write_text("---\ntags:\n---\nnur text.\n", encoding="utf-8")
+    _process_file(note, rules)
+    assert frontmatter.load(note)["tags"] == []
+
+    note.write_text("---\ntags: misc\n---\nPyTorch notes.\n", encoding="utf-8")
+    _process_file(note, rules)
+    assert frontmatter.load(note)["tags"] == ["ai", "misc"]
+
+
+def test_tag_note_with_memo_skips_yaml(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("---\ntags:\n- misc\n---\nPyTorch notes.\n", encoding="utf-8")
+    rules = normalize_rules([{"tag": "ai", "keywords": ["pytorch"]}])
+
+    text, memo = _tag_note(note, rules)
+    assert frontmatter.loads(text)["tags"] == ["ai", "misc"]
+    assert memo == {"meta": {"tags": ["misc"]}, "offset": len("---\ntags:\n- misc\n---")}
+
+    # Kopf unlesbar machen: mit Memo wird er nicht mehr geparst
+    note.write_text("---\ntags: [misc\n---\nPyTorch notes.\n", encoding="utf-8")
+    memo["offset"] = len("---\ntags: [misc\n---")
+    assert _tag_note(note, (), memo) == (None, memo)
@@ -0,0 +1,77 @@
+import frontmatter
+
+from secondbrain.vault_io import iter_md, read_fm, write_bytes, write_if_changed, write_parallel
+
+
+def test_iter_md_skips_system_folders(tmp_path):
+    (tmp_path / "01_Projects" / "app").mkdir(parents=True)
+    (tmp_path / ".obsidian").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "root.md").write_text("# Root")
+    (tmp_path / "01_Projects" / "app" / "plan.md").write_text("# Plan")
+    (tmp_path / "01_Projects" / "image.png").write_bytes(b"")
+    (tmp_path / ".obsidian" / "workspace.md").write_text("")
+    (tmp_path / ".git" / "notes.md").write_text("")
+
+    found = sorted(iter_md(tmp_path))
+
+    assert found == [
+        str(tmp_path / "01_Projects" / "app" / "plan.md"),
+        str(tmp_path / "root.md"),
+    ]
+
+
+def test_read_fm_matches_frontmatter(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("---\ntitle: Plan\ntags: [a, b]\n---\n\n# Body\n\n---\nnot: yaml\n", encoding="utf-8")
+    assert read_fm(note) == frontmatter.load(note).metadata == {"title": "Plan", "tags": ["a", "b"]}
+
+
+def test_read_fm_reads_past_limit_and_handles_missing_header(tmp_path):
+    long_note = tmp_path / "long.md"
+    long_note.write_text("---\nsummary: " + "x" * 100 + "\n---\nBody\n", encoding="utf-8")
+    plain = tmp_path / "plain.md"
+    plain.write_text("# Only a body\n", encoding="utf-8")
+
+    assert read_fm(long_note, limit=16) == {"summary": "x" * 100}
+    assert read_fm(plain) == {}
+
+
+def test_write_parallel_skips_none(tmp_path):
+    notes = [tmp_path / f"{i}.md" for i in range(3)]
+    for n in notes:
+        n.write_text("alt", encoding="utf-8")
+
+    written = write_parallel(zip(notes, ["neu", None, "neü"]))
+
+    assert written == 2
+    assert [n.read_text(encoding="utf-8") for n in notes] == ["neu", "alt", "neü"]
+
+
+def test_write_bytes_truncates_existing_file(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_bytes(b"x" * 100)
+
+    write_bytes(note, "kurz ä\n".encode("utf-8"))
+
+    assert note.read_bytes() == "kurz ä\n".encode("utf-8")
+
+
+def test_write_if_changed_keeps_identical_file(tmp_path):
+    out = tmp_path / "Index.md"
+
+    assert write_if_changed(out, "# Index\n") is True
+    mtime = out.stat().st_mtime_ns
+    assert write_if_changed(out, "# Index\n") is False
+    assert out.stat().st_mtime_ns == mtime
+    assert write_if_changed(out, "# Indey\n") is True
+    assert out.read_text(encoding="utf-8") == "# Indey\n"
+
+
+def test_note_stem_matches_path_stem():
+    from pathlib import Path
+
+    from secondbrain.vault_io import note_stem
+
+    for p in ("/v/a.md", "/v/sub/a.b.md", "rel/Über Notiz.md", "/v/.md"):
+        assert note_stem(p) == Path(p).stem
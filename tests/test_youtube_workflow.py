@@ -0,0 +1,87 @@
+from secondbrain.youtube_workflow import extract_youtube_id, parse_tags, safe_filename
+
+
+def test_safe_filename_matches_isalnum_rule():
+    title = "Über: KI/ML - Teil 2? (Grüße_aus 東京)"
+    expected = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
+    assert safe_filename(title) == expected == "Über_ KI_ML - Teil 2_ _Grüße_aus 東京_"
+
+
+def test_safe_filename_keeps_plain_titles():
+    assert safe_filename("dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+    assert safe_filename("") == ""
+
+
+def test_extract_youtube_id():
+    assert extract_youtube_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42") == "dQw4w9WgXcQ"
+    assert extract_youtube_id("https://youtu.be/dQw4w9WgXcQ?si=x") == "dQw4w9WgXcQ"
+    assert extract_youtube_id("https://www.youtube.com/embed/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+    assert extract_youtube_id("https://youtube.com/shorts/abcDEF12345") == "abcDEF12345"
+    assert extract_youtube_id("https://example.com/video") is None
+
+
+def test_parse_tags():
+    result = "## SUMMARY\nText\n\n## TAGS\n Machine Learning, PyTorch ,, GPU\n\n## END\n"
+    assert parse_tags(result) == ["machine-learning", "pytorch", "gpu"]
+    assert parse_tags("Nur Text ohne Tags") == []
+    assert parse_tags("## TAGS") == []
+
+
+def test_has_command_is_cached(monkeypatch):
+    from secondbrain import youtube_workflow
+
+    calls = []
+    monkeypatch.setattr(youtube_workflow.shutil, "which", lambda cmd: calls.append(cmd) or "/usr/bin/" + cmd)
+    youtube_workflow.find_command.cache_clear()
+    try:
+        assert youtube_workflow.has_command("fabric")
+        assert youtube_workflow.has_command("fabric")
+        assert youtube_workflow.find_command("fabric") == "/usr/bin/fabric"
+        assert calls == ["fabric"]
+    finally:
+        youtube_workflow.find_command.cache_clear()
+
+
+def _fake_fabric(args, input_text=None):
+    import subprocess
+
+    url = args[-1]
+    if "fail" in url:
+        raise subprocess.CalledProcessError(1, ["fabric", *args], stderr="kein Transkript".encode("utf-8"))
+    return "" if "empty" in url else f"Transkript {url}"
+
+
+def test_prefetch_transcripts_is_silent_and_keeps_messages_per_url(monkeypatch, capsys):
+    from secondbrain import youtube_workflow
+
+    monkeypatch.setattr(youtube_workflow, "_run_fabric", _fake_fabric)
+    urls = ["https://youtu.be/ok", "https://youtu.be/fail", "https://youtu.be/empty", "https://youtu.be/ok"]
+
+    result = youtube_workflow.prefetch_transcripts(urls)
+
+    assert capsys.readouterr().out == ""
+    assert list(result) == urls[:3]
+    assert result[urls[0]] == ("Transkript https://youtu.be/ok", [])
+    assert result[urls[1]] == ("", ["❌ Fabric Fehler: kein Transkript", "⚠️  Warnung: Transkript konnte nicht geladen werden"])
+    assert result[urls[2]] == ("", ["⚠️  Warnung: Transkript konnte nicht geladen werden"])
+
+
+def test_main_prints_transcript_messages_under_their_video(tmp_path, monkeypatch, capsys):
+    from secondbrain import youtube_workflow
+
+    notes = []
+    monkeypatch.setattr(youtube_workflow, "_run_fabric", _fake_fabric)
+    monkeypatch.setattr(youtube_workflow, "has_command", lambda cmd: True)
+    monkeypatch.setattr(youtube_workflow, "create_youtube_note", lambda vault, url, transcript, *a, **k: notes.append(transcript))
+    monkeypatch.setenv("OBSIDIAN_VAULT", str(tmp_path))
+    monkeypatch.setattr("sys.argv", ["youtube-workflow", "https://youtu.be/ok", "https://youtu.be/fail", "https://youtu.be/ok2"])
+
+    youtube_workflow.main()
+
+    out = capsys.readouterr().out
+    second, third = out.index("Video 2/3"), out.index("Video 3/3")
+    assert out.index("📥 Lade Transkripte") < out.index("Video 1/3")
+    assert out.count("Fabric Fehler") == 1
+    assert second < out.index("❌ Fabric Fehler: kein Transkript") < third
+    assert second < out.index("⚠️  Warnung") < third
+    assert notes == ["Transkript https://youtu.be/ok", "", "Transkript https://youtu.be/ok2"]